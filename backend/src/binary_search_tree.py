@@ -1,6 +1,17 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from collections import deque
 from dataclasses import dataclass
+from itertools import count
 
+from search_index import SearchIndex
+
+
+# Trees above this size are not serialized whole: operation steps leave out
+# their tree_state, and clients page large trees through /tree/nodes.
+MAX_SERIALIZED_NODES = 500
+
+# Shared by every tree, so a version never repeats even across mode switches.
+_versions = count(1)
 
 @dataclass
 class TreeNode:
@@ -8,20 +19,62 @@ class TreeNode:
     left: Optional['TreeNode'] = None
     right: Optional['TreeNode'] = None
     parent: Optional['TreeNode'] = None
-
+    deleted: bool = False
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'value': self.value,
-            'left': self.left.to_dict() if self.left else None,
-            'right': self.right.to_dict() if self.right else None
-        }
+        built: Dict[int, Dict[str, Any]] = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, True))
+                for child in (node.right, node.left):
+                    if child is not None:
+                        stack.append((child, False))
+                continue
+            result = {
+                'value': node.value,
+                'left': built.pop(id(node.left)) if node.left else None,
+                'right': built.pop(id(node.right)) if node.right else None
+            }
+            if node.deleted:
+                result['deleted'] = True
+            built[id(node)] = result
+        return built[id(self)]
 
 
 class BinarySearchTree:
+    # Every walk uses a loop or an explicit stack: generated degenerate
+    # trees are far deeper than the recursion limit.
+    
     def __init__(self):
+        self._snapshot: Optional[SearchIndex] = None
         self.root: Optional[TreeNode] = None
         self.size: int = 0
         self.operation_steps: List[Dict[str, Any]] = []
+        self.access_counts: Dict[int, int] = {}
+        self.hit_depths: Dict[int, int] = {}
+        self.misses: int = 0
+        self.untraced_lookups: int = 0
+    
+    @property
+    def root(self) -> Optional[TreeNode]:
+        return self._root
+    
+    @root.setter
+    def root(self, node: Optional[TreeNode]):
+        self._root = node
+        self._keys_changed()
+    
+    def _keys_changed(self):
+        # The array snapshot only holds keys, so it survives reshaping but
+        # not a change to the key set.
+        self._snapshot = None
+        self._reshaped()
+    
+    def _reshaped(self):
+        # A new version tells paging clients their layout is stale.
+        self.version = next(_versions)
     
     def insert(self, value: int) -> bool:
         self.operation_steps = []
@@ -29,156 +82,170 @@ class BinarySearchTree:
         if self.root is None:
             self.root = TreeNode(value)
             self.size += 1
-            self.operation_steps.append({
+            self._trace({
                 'action': 'insert_root',
-                'value': value,
-                'tree_state': self.to_dict()
+                'value': value
             })
             return True
         
-        return self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node: TreeNode, value: int) -> bool:
-        if value == node.value:
-            self.operation_steps.append({
-                'action': 'duplicate_found',
-                'value': value,
-                'current_node': node.value,
-                'tree_state': self.to_dict()
-            })
-            return False
-        
-        if value < node.value:
-            if node.left is None:
-                node.left = TreeNode(value)
-                node.left.parent = node
-                self.size += 1
-                self.operation_steps.append({
-                    'action': 'insert_left',
-                    'value': value,
-                    'parent': node.value,
-                    'tree_state': self.to_dict()
-                })
-                return True
-            else:
-                self.operation_steps.append({
-                    'action': 'traverse_left',
+        node = self.root
+        while True:
+            if value == node.value:
+                self._trace({
+                    'action': 'duplicate_found',
                     'value': value,
-                    'current_node': node.value,
-                    'tree_state': self.to_dict()
+                    'current_node': node.value
                 })
-                return self._insert_recursive(node.left, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(value)
-                node.right.parent = node
+                return False
+            
+            side = 'left' if value < node.value else 'right'
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, TreeNode(value, parent=node))
                 self.size += 1
-                self.operation_steps.append({
-                    'action': 'insert_right',
+                self._keys_changed()
+                self._trace({
+                    'action': f'insert_{side}',
                     'value': value,
-                    'parent': node.value,
-                    'tree_state': self.to_dict()
+                    'parent': node.value
                 })
                 return True
-            else:
-                self.operation_steps.append({
-                    'action': 'traverse_right',
-                    'value': value,
-                    'current_node': node.value,
-                    'tree_state': self.to_dict()
-                })
-                return self._insert_recursive(node.right, value)
+            
+            self._trace({
+                'action': f'traverse_{side}',
+                'value': value,
+                'current_node': node.value
+            })
+            node = child
     
     def search(self, value: int) -> bool:
         self.operation_steps = []
-        return self._search_recursive(self.root, value)
-    
-    def _search_recursive(self, node: Optional[TreeNode], value: int) -> bool:
-        if node is None:
-            self.operation_steps.append({
-                'action': 'not_found',
+        node = self.root
+        depth = 0
+        while node is not None:
+            self._trace({
+                'action': 'visit_node',
                 'value': value,
-                'tree_state': self.to_dict()
+                'current_node': node.value
             })
-            return False
+            
+            if value == node.value:
+                self._record_access(value, depth)
+                self._trace({
+                    'action': 'found',
+                    'value': value,
+                    'current_node': node.value
+                })
+                return True
+            node = node.left if value < node.value else node.right
+            depth += 1
         
-        self.operation_steps.append({
-            'action': 'visit_node',
-            'value': value,
-            'current_node': node.value,
-            'tree_state': self.to_dict()
+        self._record_access(value, None)
+        self._trace({
+            'action': 'not_found',
+            'value': value
         })
-        
-        if value == node.value:
-            self.operation_steps.append({
-                'action': 'found',
-                'value': value,
-                'current_node': node.value,
-                'tree_state': self.to_dict()
-            })
-            return True
-        elif value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
+        return False
+    
+    def lookup(self, value: int) -> bool:
+        # Untraced membership test against the array snapshot. It never sees
+        # the tree's shape, so it is counted apart from the traced searches
+        # rather than in the hit-depth figures.
+        self.untraced_lookups += 1
+        return self.snapshot().contains(value)
+    
+    def _trace(self, step: Dict[str, Any]):
+        # A tree_state per step makes every step O(n); above the limit steps
+        # keep only their action and keys so an operation stays O(h).
+        if self.size <= MAX_SERIALIZED_NODES:
+            step['tree_state'] = self.to_dict()
+        self.operation_steps.append(step)
+    
+    def _record_access(self, value: int, depth: Optional[int]):
+        if depth is None:
+            self.misses += 1
+            return
+        self.access_counts[value] = self.access_counts.get(value, 0) + 1
+        self.hit_depths[depth] = self.hit_depths.get(depth, 0) + 1
+    
+    def access_stats(self, top: int = 10) -> Dict[str, Any]:
+        hits = sum(self.hit_depths.values())
+        total_depth = sum(depth * count for depth, count in self.hit_depths.items())
+        hottest = sorted(self.access_counts.items(), key=lambda item: (-item[1], item[0]))[:top]
+        return {
+            'searches': hits + self.misses,
+            'hits': hits,
+            'misses': self.misses,
+            'average_hit_depth': total_depth / hits if hits else 0.0,
+            'hit_depth_distribution': dict(sorted(self.hit_depths.items())),
+            'top_keys': [{'value': value, 'count': count} for value, count in hottest],
+            'untraced_lookups': self.untraced_lookups
+        }
+    
+    def reset_access_stats(self):
+        self.access_counts = {}
+        self.hit_depths = {}
+        self.misses = 0
+        self.untraced_lookups = 0
     
     def delete(self, value: int) -> bool:
         self.operation_steps = []
-        self.root, deleted = self._delete_recursive(self.root, value)
-        if deleted:
-            self.size -= 1
-        return deleted
-    
-    def _delete_recursive(self, node: Optional[TreeNode], value: int) -> tuple[Optional[TreeNode], bool]:
+        node = self._delete_descend(self.root, value)
         if node is None:
-            self.operation_steps.append({
+            self._trace({
                 'action': 'delete_not_found',
+                'value': value
+            })
+            return False
+        
+        if node.left is not None and node.right is not None:
+            successor = self._find_min(node.right)
+            self._trace({
+                'action': 'delete_two_children',
                 'value': value,
-                'tree_state': self.to_dict()
+                'successor': successor.value
             })
-            return None, False
+            node.value = value = successor.value
+            node = self._delete_descend(node.right, value)
         
-        self.operation_steps.append({
-            'action': 'delete_visit',
-            'value': value,
-            'current_node': node.value,
-            'tree_state': self.to_dict()
-        })
+        if node.left is None:
+            replacement = node.right
+            self._trace({
+                'action': 'delete_no_left',
+                'value': value,
+                'replacement': replacement.value if replacement else None
+            })
+        else:
+            replacement = node.left
+            self._trace({
+                'action': 'delete_no_right',
+                'value': value,
+                'replacement': replacement.value
+            })
         
-        if value < node.value:
-            node.left, deleted = self._delete_recursive(node.left, value)
-            return node, deleted
-        elif value > node.value:
-            node.right, deleted = self._delete_recursive(node.right, value)
-            return node, deleted
+        if replacement is not None:
+            replacement.parent = node.parent
+        if node.parent is None:
+            self.root = replacement
+        elif node.parent.left is node:
+            node.parent.left = replacement
         else:
-            if node.left is None:
-                self.operation_steps.append({
-                    'action': 'delete_no_left',
-                    'value': value,
-                    'replacement': node.right.value if node.right else None,
-                    'tree_state': self.to_dict()
-                })
-                return node.right, True
-            elif node.right is None:
-                self.operation_steps.append({
-                    'action': 'delete_no_right',
-                    'value': value,
-                    'replacement': node.left.value,
-                    'tree_state': self.to_dict()
-                })
-                return node.left, True
-            else:
-                successor = self._find_min(node.right)
-                self.operation_steps.append({
-                    'action': 'delete_two_children',
-                    'value': value,
-                    'successor': successor.value,
-                    'tree_state': self.to_dict()
-                })
-                node.value = successor.value
-                node.right, _ = self._delete_recursive(node.right, successor.value)
-                return node, True
+            node.parent.right = replacement
+        self.size -= 1
+        self._keys_changed()
+        return True
+    
+    def _delete_descend(self, node: Optional[TreeNode], value: int) -> Optional[TreeNode]:
+        while node is not None:
+            self._trace({
+                'action': 'delete_visit',
+                'value': value,
+                'current_node': node.value
+            })
+            if value == node.value:
+                return node
+            node = node.left if value < node.value else node.right
+        return None
     
     def _find_min(self, node: TreeNode) -> TreeNode:
         while node.left is not None:
@@ -186,48 +253,59 @@ class BinarySearchTree:
         return node
     
     def inorder_traversal(self) -> List[int]:
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        return list(self._inorder_iter())
     
-    def _inorder_recursive(self, node: Optional[TreeNode], result: List[int]):
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
+    def _inorder_iter(self) -> Iterator[int]:
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if not node.deleted:
+                yield node.value
+            node = node.right
     
     def preorder_traversal(self) -> List[int]:
         result = []
-        self._preorder_recursive(self.root, result)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if not node.deleted:
+                result.append(node.value)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
         return result
     
-    def _preorder_recursive(self, node: Optional[TreeNode], result: List[int]):
-        if node is not None:
-            result.append(node.value)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
-    
     def postorder_traversal(self) -> List[int]:
+        # Root, right, left read backwards is left, right, root.
         result = []
-        self._postorder_recursive(self.root, result)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if not node.deleted:
+                result.append(node.value)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        result.reverse()
         return result
     
-    def _postorder_recursive(self, node: Optional[TreeNode], result: List[int]):
-        if node is not None:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.value)
-    
     def level_order_traversal(self) -> List[int]:
         if self.root is None:
             return []
         
         result = []
-        queue = [self.root]
+        queue = deque([self.root])
         
         while queue:
-            node = queue.pop(0)
-            result.append(node.value)
+            node = queue.popleft()
+            if not node.deleted:
+                result.append(node.value)
             
             if node.left is not None:
                 queue.append(node.left)
@@ -237,12 +315,160 @@ class BinarySearchTree:
         return result
     
     def height(self) -> int:
-        return self._height_recursive(self.root)
+        height = -1
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
     
-    def _height_recursive(self, node: Optional[TreeNode]) -> int:
-        if node is None:
-            return -1
-        return 1 + max(self._height_recursive(node.left), self._height_recursive(node.right))
+    def build_from_sorted(self, values: List[int]):
+        self.root = self._build_balanced(values, 0, len(values) - 1, None)
+        self.size = len(values)
+        self.operation_steps = []
+    
+    def _build_balanced(self, values: List[int], lo: int, hi: int, parent: Optional[TreeNode]) -> Optional[TreeNode]:
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = TreeNode(values[mid], parent=parent)
+        node.left = self._build_balanced(values, lo, mid - 1, node)
+        node.right = self._build_balanced(values, mid + 1, hi, node)
+        return node
+    
+    def adopt(self, root: Optional[TreeNode], size: int):
+        # Takes over nodes linked elsewhere: a generated tree, a set
+        # operation result or another mode's tree.
+        self.root = root
+        self.size = size
+        self.operation_steps = []
+    
+    def snapshot(self, layout: str = 'eytzinger') -> SearchIndex:
+        # Frozen array copy of the keys for untraced reads. Anything that
+        # changes the key set drops it and the next read rebuilds it.
+        if self._snapshot is None or self._snapshot.layout != layout:
+            self._snapshot = SearchIndex(self._inorder_iter(), layout)
+        return self._snapshot
+    
+    def union(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        return self._combine(other, keep_left=True, keep_both=True, keep_right=True)
+    
+    def intersection(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        return self._combine(other, keep_left=False, keep_both=True, keep_right=False)
+    
+    def difference(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        return self._combine(other, keep_left=True, keep_both=False, keep_right=False)
+    
+    def merge(self, other: 'BinarySearchTree'):
+        merged = self.union(other)
+        self.root = merged.root
+        self.size = merged.size
+        self.operation_steps = []
+    
+    def _combine(self, other: 'BinarySearchTree', keep_left: bool, keep_both: bool, keep_right: bool) -> 'BinarySearchTree':
+        # Walks both inorder sequences side by side, so the result costs
+        # O(m + n) and is rebuilt balanced whatever shape the inputs had.
+        values = []
+        left, right = self._inorder_iter(), other._inorder_iter()
+        a, b = next(left, None), next(right, None)
+        
+        while a is not None and b is not None:
+            if a < b:
+                if keep_left:
+                    values.append(a)
+                a = next(left, None)
+            elif b < a:
+                if keep_right:
+                    values.append(b)
+                b = next(right, None)
+            else:
+                if keep_both:
+                    values.append(a)
+                a, b = next(left, None), next(right, None)
+        
+        if keep_left and a is not None:
+            values.append(a)
+            values.extend(left)
+        if keep_right and b is not None:
+            values.append(b)
+            values.extend(right)
+        
+        result = BinarySearchTree()
+        result.build_from_sorted(values)
+        return result
+    
+    def split(self, value: int) -> Tuple['BinarySearchTree', 'BinarySearchTree']:
+        # Cuts the search path for value into a tree of keys < value and a
+        # tree of keys >= value, reusing the existing nodes. This tree is
+        # left empty.
+        smaller, larger = BinarySearchTree(), BinarySearchTree()
+        left_hook: Optional[TreeNode] = None
+        right_hook: Optional[TreeNode] = None
+        node = self.root
+        
+        while node is not None:
+            if node.value < value:
+                if left_hook is None:
+                    smaller.root = node
+                else:
+                    left_hook.right = node
+                node.parent = left_hook
+                left_hook = node
+                node = node.right
+            else:
+                if right_hook is None:
+                    larger.root = node
+                else:
+                    right_hook.left = node
+                node.parent = right_hook
+                right_hook = node
+                node = node.left
+        
+        if left_hook is not None:
+            left_hook.right = None
+        if right_hook is not None:
+            right_hook.left = None
+        
+        smaller.size = sum(1 for _ in smaller._inorder_iter())
+        larger.size = self.size - smaller.size
+        self.clear()
+        return smaller, larger
+    
+    def join(self, other: 'BinarySearchTree'):
+        # Appends a tree whose keys are all greater than this tree's keys in
+        # O(h): the maximum of this tree becomes the new root. other is left
+        # empty.
+        if other.root is None:
+            return
+        if self.root is None:
+            self.root, self.size = other.root, other.size
+            other.clear()
+            return
+        
+        parent = None
+        pivot = self.root
+        while pivot.right is not None:
+            parent, pivot = pivot, pivot.right
+        if pivot.value >= self._find_min(other.root).value:
+            raise ValueError("Every key in the joined tree must be greater than the keys in this tree")
+        
+        if parent is None:
+            rest = pivot.left
+        else:
+            parent.right = pivot.left
+            rest = self.root
+        if pivot.left is not None:
+            pivot.left.parent = parent
+        
+        pivot.left, pivot.right, pivot.parent = rest, other.root, None
+        if rest is not None:
+            rest.parent = pivot
+        other.root.parent = pivot
+        
+        self.root = pivot
+        self.size += other.size
+        self.operation_steps = []
+        other.clear()
     
     def is_empty(self) -> bool:
         return self.root is None
@@ -251,6 +477,7 @@ class BinarySearchTree:
         self.root = None
         self.size = 0
         self.operation_steps = []
+        self.reset_access_stats()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -267,14 +494,18 @@ class BinarySearchTree:
         if self.is_empty():
             return "Empty BST"
         
-        def _build_tree_string(node: Optional[TreeNode], prefix: str = "", is_left: bool = True) -> str:
-            if node is None:
-                return ""
-            
-            result = ""
-            result += _build_tree_string(node.right, prefix + ("│   " if is_left else "    "), False)
-            result += prefix + ("└── " if is_left else "┌── ") + str(node.value) + "\n"
-            result += _build_tree_string(node.left, prefix + ("    " if is_left else "│   "), True)
-            return result
-        
-        return _build_tree_string(self.root).rstrip()
\ No newline at end of file
+        # Right subtree above its node and left subtree below, so the tree
+        # reads rotated a quarter turn.
+        lines = []
+        stack = [(self.root, "", True, False)]
+        while stack:
+            node, prefix, is_left, expanded = stack.pop()
+            if expanded:
+                lines.append(prefix + ("└── " if is_left else "┌── ") + str(node.value))
+                continue
+            if node.left is not None:
+                stack.append((node.left, prefix + ("    " if is_left else "│   "), True, False))
+            stack.append((node, prefix, is_left, True))
+            if node.right is not None:
+                stack.append((node.right, prefix + ("│   " if is_left else "    "), False, False))
+        return "\n".join(lines)
\ No newline at end of file
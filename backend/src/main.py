@@ -1,22 +1,67 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, Field
+from array import array
+from typing import List, Dict, Any, Optional, Tuple, Annotated
+from collections import OrderedDict
+import os
 import uvicorn
 
-from binary_search_tree import BinarySearchTree
+from binary_search_tree import BinarySearchTree, MAX_SERIALIZED_NODES
+from splay_tree import SplayTree
+from scapegoat_tree import ScapegoatTree
+from tree_generator import generate_tree
+from tree_analytics import SharedTreeSnapshot, snapshot_stats
+from tree_layout import FIELDS, node_layout
+
+
+# The search snapshot, the analytics export and the node layout store keys
+# in 64-bit typed arrays, so keys are rejected outside that range.
+Key = Annotated[int, Field(ge=-2**63, le=2**63 - 1)]
 
 
 class InsertRequest(BaseModel):
-    value: int
+    value: Key
 
 
 class DeleteRequest(BaseModel):
-    value: int
+    value: Key
 
 
 class SearchRequest(BaseModel):
-    value: int
+    value: Key
+    trace: bool = True
+
+
+class GenerateRequest(BaseModel):
+    size: int = 15
+    seed: Optional[int] = None
+    distribution: str = "uniform"
+    shape: str = "random"
+
+
+class SaveTreeRequest(BaseModel):
+    tree_id: str
+
+
+class SetOperationRequest(BaseModel):
+    tree_id: Optional[str] = None
+    values: Optional[List[Key]] = None
+
+
+class SplitRequest(BaseModel):
+    value: Key
+    tree_id: str
+
+
+class JoinRequest(BaseModel):
+    tree_id: str
+
+
+class ModeRequest(BaseModel):
+    mode: str
+    options: Dict[str, float] = {}
 
 
 class TraversalResponse(BaseModel):
@@ -36,6 +81,14 @@ class TreeStateResponse(BaseModel):
     operation_steps: List[Dict[str, Any]]
 
 
+class GenerateResponse(BaseModel):
+    success: bool
+    message: str
+    size: int
+    height: int
+    tree_state: Dict[str, Any]
+
+
 app = FastAPI(
     title="Binary Search Tree API",
     description="A comprehensive API for BST operations with visualization support",
@@ -51,6 +104,40 @@ app.add_middleware(
 )
 
 bst = BinarySearchTree()
+saved_trees: Dict[str, BinarySearchTree] = {}
+
+TREE_MODES = {
+    "static": BinarySearchTree,
+    "splay": SplayTree,
+    "scapegoat": ScapegoatTree
+}
+
+
+def _tree_mode() -> str:
+    for mode, tree_class in TREE_MODES.items():
+        if type(bst) is tree_class:
+            return mode
+    return "static"
+
+NODE_PAGE_LIMIT = 50000
+MAX_CACHED_LAYOUT_NODES = 2000000
+LAYOUT_BUILD_ATTEMPTS = 3
+
+# Layouts served by /tree/nodes, keyed by snapshot id so each client keeps
+# paging the tree it started on. Ids are tree versions, so clients reading
+# the same tree share one layout. Past MAX_CACHED_LAYOUT_NODES rows the
+# least recently used layouts are evicted, but never the newest.
+node_pages: "OrderedDict[str, Dict[str, array]]" = OrderedDict()
+
+# (version, height) of the last tree measured; height() walks every node.
+cached_height: Tuple[int, int] = (0, 0)
+
+
+def _tree_height() -> int:
+    global cached_height
+    if cached_height[0] != bst.version:
+        cached_height = (bst.version, bst.height())
+    return cached_height[1]
 
 
 @app.get("/")
@@ -69,15 +156,46 @@ async def root():
             "GET /tree/traversal/levelorder": "Get level-order traversal",
             "POST /tree/clear": "Clear the tree",
             "GET /tree/height": "Get tree height",
-            "GET /tree/size": "Get tree size"
+            "GET /tree/size": "Get tree size",
+            "GET /tree/random": "Generate a small random tree",
+            "POST /tree/generate": "Generate a synthetic tree from a seed, distribution and shape",
+            "POST /tree/save": "Save a copy of the tree under an id",
+            "POST /tree/union": "Union with a saved tree or a batch of values",
+            "POST /tree/intersection": "Intersect with a saved tree or a batch of values",
+            "POST /tree/difference": "Remove the keys of a saved tree or a batch of values",
+            "POST /tree/split": "Split off keys >= value into a saved tree",
+            "POST /tree/join": "Append a saved tree whose keys are all greater",
+            "POST /tree/mode": "Switch between static, splay and scapegoat mode",
+            "GET /tree/access-stats": "Get per-key access counts and hit-depth distribution",
+            "POST /tree/access-stats/reset": "Reset access statistics",
+            "GET /tree/rank": "Count values smaller than a value",
+            "GET /tree/select": "Get the k-th smallest value",
+            "GET /tree/stats": "Validate the tree and get depth, balance and key-gap statistics",
+            "GET /tree/nodes": "Page through a flat node layout for large trees"
         }
     }
 
 
+def _tree_state() -> Dict[str, Any]:
+    # Trees above MAX_SERIALIZED_NODES are too large to send as nested JSON.
+    # Clients page them through /tree/nodes and fetch again only when the
+    # version changes.
+    if bst.size <= MAX_SERIALIZED_NODES:
+        return bst.to_dict()
+    return {
+        'root': None,
+        'size': bst.size,
+        'height': _tree_height(),
+        'is_empty': False,
+        'paged': True,
+        'version': bst.version
+    }
+
+
 @app.get("/tree", response_model=TreeStateResponse)
 async def get_tree_state():
     return TreeStateResponse(
-        tree_state=bst.to_dict(),
+        tree_state=_tree_state(),
         operation_steps=bst.get_operation_steps()
     )
 
@@ -91,7 +209,7 @@ async def insert_value(request: InsertRequest):
         return OperationResponse(
             success=success,
             message=message,
-            tree_state=bst.to_dict(),
+            tree_state=_tree_state(),
             operation_steps=bst.get_operation_steps()
         )
     except Exception as e:
@@ -107,7 +225,7 @@ async def delete_value(request: DeleteRequest):
         return OperationResponse(
             success=success,
             message=message,
-            tree_state=bst.to_dict(),
+            tree_state=_tree_state(),
             operation_steps=bst.get_operation_steps()
         )
     except Exception as e:
@@ -117,14 +235,22 @@ async def delete_value(request: DeleteRequest):
 @app.post("/tree/search", response_model=OperationResponse)
 async def search_value(request: SearchRequest):
     try:
-        found = bst.search(request.value)
+        # Untraced lookups on a static tree go to the array snapshot, which
+        # has no steps to record and no shape to adjust. They are counted as
+        # untraced_lookups in /tree/access-stats, without a hit depth.
+        if not request.trace and _tree_mode() == "static":
+            found = bst.lookup(request.value)
+            operation_steps = []
+        else:
+            found = bst.search(request.value)
+            operation_steps = bst.get_operation_steps()
         message = f"Value {request.value} found" if found else f"Value {request.value} not found"
         
         return OperationResponse(
             success=found,
             message=message,
-            tree_state=bst.to_dict(),
-            operation_steps=bst.get_operation_steps()
+            tree_state=_tree_state(),
+            operation_steps=operation_steps
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching value: {str(e)}")
@@ -136,7 +262,7 @@ async def inorder_traversal():
         traversal = bst.inorder_traversal()
         return TraversalResponse(
             traversal=traversal,
-            tree_state=bst.to_dict()
+            tree_state=_tree_state()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting inorder traversal: {str(e)}")
@@ -148,7 +274,7 @@ async def preorder_traversal():
         traversal = bst.preorder_traversal()
         return TraversalResponse(
             traversal=traversal,
-            tree_state=bst.to_dict()
+            tree_state=_tree_state()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting preorder traversal: {str(e)}")
@@ -160,7 +286,7 @@ async def postorder_traversal():
         traversal = bst.postorder_traversal()
         return TraversalResponse(
             traversal=traversal,
-            tree_state=bst.to_dict()
+            tree_state=_tree_state()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting postorder traversal: {str(e)}")
@@ -172,7 +298,7 @@ async def level_order_traversal():
         traversal = bst.level_order_traversal()
         return TraversalResponse(
             traversal=traversal,
-            tree_state=bst.to_dict()
+            tree_state=_tree_state()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting level-order traversal: {str(e)}")
@@ -185,7 +311,7 @@ async def clear_tree():
         return OperationResponse(
             success=True,
             message="Tree cleared successfully",
-            tree_state=bst.to_dict(),
+            tree_state=_tree_state(),
             operation_steps=[]
         )
     except Exception as e:
@@ -195,10 +321,10 @@ async def clear_tree():
 @app.get("/tree/height")
 async def get_height():
     try:
-        height = bst.height()
+        height = _tree_height()
         return {
             "height": height,
-            "tree_state": bst.to_dict()
+            "tree_state": _tree_state()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting height: {str(e)}")
@@ -210,19 +336,20 @@ async def get_size():
         size = bst.size
         return {
             "size": size,
-            "tree_state": bst.to_dict()
+            "tree_state": _tree_state()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting size: {str(e)}")
 
 
 @app.get("/tree/random")
-async def generate_random_tree():
+async def generate_random_tree(seed: Optional[int] = None):
     import random
     
     try:
         bst.clear()
-        values = random.sample(range(1, 21), random.randint(5, 15))
+        rng = random.Random(seed)
+        values = rng.sample(range(1, 21), rng.randint(5, 15))
         
         for value in values:
             bst.insert(value)
@@ -230,12 +357,310 @@ async def generate_random_tree():
         return OperationResponse(
             success=True,
             message=f"Random tree generated with {len(values)} values",
-            tree_state=bst.to_dict(),
+            tree_state=_tree_state(),
             operation_steps=[]
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating random tree: {str(e)}")
 
 
+@app.post("/tree/generate", response_model=GenerateResponse)
+async def generate_synthetic_tree(request: GenerateRequest):
+    try:
+        # Large builds take seconds, so they run in the thread pool on a
+        # fresh tree that is only swapped in once complete; other requests
+        # keep using the current tree meanwhile.
+        generated = await run_in_threadpool(
+            generate_tree,
+            request.size,
+            seed=request.seed,
+            distribution=request.distribution,
+            shape=request.shape
+        )
+        _replace_tree(generated)
+        bst.reset_access_stats()
+        tree_state = _tree_state()
+        return GenerateResponse(
+            success=True,
+            message=f"Generated {request.shape} tree with {bst.size} {request.distribution} keys",
+            size=bst.size,
+            height=tree_state['height'],
+            tree_state=tree_state
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating tree: {str(e)}")
+
+
+def _tree_from_values(values: List[int]) -> BinarySearchTree:
+    tree = BinarySearchTree()
+    tree.build_from_sorted(sorted(set(values)))
+    return tree
+
+
+def _resolve_operand(request: SetOperationRequest) -> BinarySearchTree:
+    if request.tree_id is not None and request.values is not None:
+        raise HTTPException(status_code=400, detail="Provide either tree_id or values, not both")
+    if request.tree_id is not None:
+        if request.tree_id not in saved_trees:
+            raise HTTPException(status_code=404, detail=f"Tree '{request.tree_id}' not found")
+        return saved_trees[request.tree_id]
+    if request.values is not None:
+        return _tree_from_values(request.values)
+    raise HTTPException(status_code=400, detail="Either tree_id or values must be provided")
+
+
+def _replace_tree(result: BinarySearchTree):
+    bst.adopt(result.root, result.size)
+
+
+@app.post("/tree/save", response_model=OperationResponse)
+async def save_tree(request: SaveTreeRequest):
+    try:
+        saved_trees[request.tree_id] = _tree_from_values(bst.inorder_traversal())
+        return OperationResponse(
+            success=True,
+            message=f"Tree saved as '{request.tree_id}'",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error saving tree: {str(e)}")
+
+
+@app.post("/tree/union", response_model=OperationResponse)
+async def union_tree(request: SetOperationRequest):
+    other = _resolve_operand(request)
+    try:
+        bst.merge(other)
+        return OperationResponse(
+            success=True,
+            message=f"Union contains {bst.size} values",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing union: {str(e)}")
+
+
+@app.post("/tree/intersection", response_model=OperationResponse)
+async def intersection_tree(request: SetOperationRequest):
+    other = _resolve_operand(request)
+    try:
+        _replace_tree(bst.intersection(other))
+        return OperationResponse(
+            success=True,
+            message=f"Intersection contains {bst.size} values",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing intersection: {str(e)}")
+
+
+@app.post("/tree/difference", response_model=OperationResponse)
+async def difference_tree(request: SetOperationRequest):
+    other = _resolve_operand(request)
+    try:
+        _replace_tree(bst.difference(other))
+        return OperationResponse(
+            success=True,
+            message=f"Difference contains {bst.size} values",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing difference: {str(e)}")
+
+
+@app.post("/tree/split", response_model=OperationResponse)
+async def split_tree(request: SplitRequest):
+    if request.tree_id in saved_trees:
+        raise HTTPException(status_code=409, detail=f"Tree '{request.tree_id}' already exists")
+    try:
+        smaller, larger = bst.split(request.value)
+        _replace_tree(smaller)
+        saved_trees[request.tree_id] = larger
+        return OperationResponse(
+            success=True,
+            message=f"Split {larger.size} values >= {request.value} into '{request.tree_id}'",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error splitting tree: {str(e)}")
+
+
+@app.post("/tree/join", response_model=OperationResponse)
+async def join_tree(request: JoinRequest):
+    if request.tree_id not in saved_trees:
+        raise HTTPException(status_code=404, detail=f"Tree '{request.tree_id}' not found")
+    try:
+        bst.join(saved_trees[request.tree_id])
+        del saved_trees[request.tree_id]
+        return OperationResponse(
+            success=True,
+            message=f"Joined '{request.tree_id}', tree now has {bst.size} values",
+            tree_state=_tree_state(),
+            operation_steps=[]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error joining tree: {str(e)}")
+
+
+@app.post("/tree/mode", response_model=OperationResponse)
+async def set_tree_mode(request: ModeRequest):
+    global bst
+    
+    if request.mode not in TREE_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown mode '{request.mode}', expected one of {', '.join(TREE_MODES)}"
+        )
+    try:
+        tree = TREE_MODES[request.mode](**request.options)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid options for {request.mode} mode: {str(e)}")
+    try:
+        # Tombstones only mean something to the scapegoat tree, so they are
+        # purged before its nodes are handed to another mode.
+        if isinstance(bst, ScapegoatTree):
+            bst.compact()
+        tree.adopt(bst.root, bst.size)
+        bst = tree
+        return OperationResponse(
+            success=True,
+            message=f"Tree switched to {request.mode} mode",
+            tree_state=_tree_state(),
+            operation_steps=bst.get_operation_steps()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error switching mode: {str(e)}")
+
+
+@app.get("/tree/access-stats")
+async def get_access_stats(top: int = 10):
+    try:
+        return {
+            "mode": _tree_mode(),
+            **bst.access_stats(top),
+            "height": _tree_height()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting access stats: {str(e)}")
+
+
+@app.post("/tree/access-stats/reset")
+async def reset_access_stats():
+    try:
+        bst.reset_access_stats()
+        return {"success": True, "message": "Access statistics reset"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error resetting access stats: {str(e)}")
+
+
+@app.get("/tree/rank")
+async def get_rank(value: int, layout: str = "eytzinger"):
+    try:
+        return {
+            "value": value,
+            "rank": bst.snapshot(layout).rank(value),
+            "size": bst.size
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting rank: {str(e)}")
+
+
+@app.get("/tree/select")
+async def select_value(k: int, layout: str = "eytzinger"):
+    try:
+        return {
+            "k": k,
+            "value": bst.snapshot(layout).select(k),
+            "size": bst.size
+        }
+    except (ValueError, IndexError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error selecting value: {str(e)}")
+
+
+@app.get("/tree/stats")
+async def get_tree_stats(workers: Optional[int] = None):
+    max_workers = os.cpu_count() or 1
+    if workers is not None and workers > max_workers:
+        raise HTTPException(status_code=400, detail=f"workers must be at most {max_workers}")
+    try:
+        # The snapshot is copied on the event loop, where no other request
+        # can change the tree mid-copy; only the walk over it leaves the loop.
+        size = bst.size
+        with SharedTreeSnapshot(bst) as snapshot:
+            stats = await run_in_threadpool(snapshot_stats, snapshot, workers)
+        return {
+            "size": size,
+            **stats
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting tree stats: {str(e)}")
+
+
+async def _build_layout() -> Tuple[str, Dict[str, array]]:
+    # Large layouts take seconds, so they are built in the thread pool. A
+    # build that overlapped a change to the tree may be torn and is thrown
+    # away; after repeated overlaps the layout is built on the loop, where
+    # nothing can interleave.
+    for _ in range(LAYOUT_BUILD_ATTEMPTS):
+        version = bst.version
+        layout = await run_in_threadpool(node_layout, bst)
+        if bst.version == version:
+            return str(version), layout
+    return str(bst.version), node_layout(bst)
+
+
+def _cache_layout(snapshot_id: str, layout: Dict[str, array]) -> None:
+    node_pages[snapshot_id] = layout
+    cached = sum(len(pages['value']) for pages in node_pages.values())
+    while cached > MAX_CACHED_LAYOUT_NODES and len(node_pages) > 1:
+        _, evicted = node_pages.popitem(last=False)
+        cached -= len(evicted['value'])
+
+
+@app.get("/tree/nodes")
+async def get_tree_nodes(offset: int = 0, limit: int = 10000, snapshot_id: Optional[str] = None):
+    if offset < 0 or not 0 < limit <= NODE_PAGE_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"offset must be non-negative and limit between 1 and {NODE_PAGE_LIMIT}"
+        )
+    try:
+        # Without an id, or with one that has been evicted, paging restarts
+        # on the current tree; clients restart when the id they get back
+        # differs from the one they sent.
+        if snapshot_id not in node_pages:
+            offset = 0
+            snapshot_id = str(bst.version)
+            if snapshot_id not in node_pages:
+                snapshot_id, layout = await _build_layout()
+                _cache_layout(snapshot_id, layout)
+        node_pages.move_to_end(snapshot_id)
+        layout = node_pages[snapshot_id]
+        return {
+            "snapshot_id": snapshot_id,
+            "total": len(layout['value']),
+            "offset": offset,
+            "fields": list(FIELDS),
+            "nodes": list(zip(*(layout[field][offset:offset + limit] for field in FIELDS)))
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting tree nodes: {str(e)}")
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
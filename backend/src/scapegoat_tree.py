@@ -0,0 +1,243 @@
+import math
+from typing import Optional, List, Tuple
+
+from binary_search_tree import BinarySearchTree, TreeNode
+
+
+class ScapegoatTree(BinarySearchTree):
+    # Deletes only mark a tombstone at the end of one descent. Balance comes
+    # back through rebuilds instead of rotations: an insert that lands deeper
+    # than log_{1/alpha}(n) rebuilds the lowest alpha-unbalanced ancestor,
+    # the first one met walking back up from the new node, and once
+    # tombstones make up more than tombstone_ratio of the nodes the whole
+    # tree is rebuilt, which keeps updates amortized O(log n).
+
+    def __init__(self, alpha: float = 0.7, tombstone_ratio: float = 0.5):
+        if not 0.5 < alpha < 1:
+            raise ValueError("alpha must be greater than 0.5 and less than 1")
+        if not 0 < tombstone_ratio < 1:
+            raise ValueError("tombstone_ratio must be greater than 0 and less than 1")
+        self.alpha = alpha
+        self.tombstone_ratio = tombstone_ratio
+        self.tombstones = 0
+        super().__init__()
+
+    @BinarySearchTree.root.setter
+    def root(self, node: Optional[TreeNode]):
+        # A new root is either a fresh tree or a full rebuild, neither of
+        # which carries tombstones.
+        self._root = node
+        self._keys_changed()
+        self.tombstones = 0
+
+    def insert(self, value: int) -> bool:
+        self.operation_steps = []
+
+        if self.root is None:
+            self.root = TreeNode(value)
+            self.size += 1
+            self._trace({
+                'action': 'insert_root',
+                'value': value
+            })
+            return True
+
+        path: List[TreeNode] = []
+        node = self.root
+        while True:
+            path.append(node)
+            if value == node.value:
+                return self._revive(node)
+
+            child = node.left if value < node.value else node.right
+            if child is None:
+                break
+            self._trace({
+                'action': 'traverse_left' if value < node.value else 'traverse_right',
+                'value': value,
+                'current_node': node.value
+            })
+            node = child
+
+        inserted = TreeNode(value, parent=node)
+        if value < node.value:
+            node.left = inserted
+        else:
+            node.right = inserted
+        self.size += 1
+        self._keys_changed()
+        self._trace({
+            'action': 'insert_left' if value < node.value else 'insert_right',
+            'value': value,
+            'parent': node.value
+        })
+
+        if len(path) > self._max_depth():
+            self._rebuild_scapegoat(path, inserted, value)
+        return True
+
+    def _revive(self, node: TreeNode) -> bool:
+        if not node.deleted:
+            self._trace({
+                'action': 'duplicate_found',
+                'value': node.value,
+                'current_node': node.value
+            })
+            return False
+
+        node.deleted = False
+        self.tombstones -= 1
+        self.size += 1
+        self._keys_changed()
+        self._trace({
+            'action': 'insert_revive',
+            'value': node.value,
+            'current_node': node.value
+        })
+        return True
+
+    def search(self, value: int) -> bool:
+        self.operation_steps = []
+        node, depth = self._descend(value, 'visit_node')
+
+        if node is None or node.deleted:
+            self._record_access(value, None)
+            self._trace({
+                'action': 'not_found',
+                'value': value
+            })
+            return False
+
+        self._record_access(value, depth)
+        self._trace({
+            'action': 'found',
+            'value': value,
+            'current_node': node.value
+        })
+        return True
+
+    def delete(self, value: int) -> bool:
+        self.operation_steps = []
+        node, _ = self._descend(value, 'delete_visit')
+
+        if node is None or node.deleted:
+            self._trace({
+                'action': 'delete_not_found',
+                'value': value
+            })
+            return False
+
+        node.deleted = True
+        self.tombstones += 1
+        self.size -= 1
+        self._keys_changed()
+        self._trace({
+            'action': 'delete_tombstone',
+            'value': value,
+            'current_node': node.value
+        })
+
+        if self.tombstones > self.tombstone_ratio * (self.size + self.tombstones):
+            self._rebuild(self.root, None, value, 'tombstones')
+        return True
+
+    def adopt(self, root: Optional[TreeNode], size: int):
+        super().adopt(root, size)
+        # Nodes from another mode can have any shape, and the rebuild rules
+        # only keep updates O(log n) on a tree that starts within the depth
+        # bound, so an adopted tree that exceeds it is rebuilt once.
+        if self.size and self.height() > self._max_depth():
+            self._rebuild(self.root, None, None, 'adopt')
+
+    def compact(self):
+        self.operation_steps = []
+        if self.tombstones:
+            self._rebuild(self.root, None, None, 'compact')
+
+    def split(self, value: int) -> Tuple[BinarySearchTree, BinarySearchTree]:
+        self.compact()
+        return super().split(value)
+
+    def join(self, other: BinarySearchTree):
+        self.compact()
+        if isinstance(other, ScapegoatTree):
+            other.compact()
+        super().join(other)
+
+    def _descend(self, value: int, visit_action: str) -> Tuple[Optional[TreeNode], int]:
+        node = self.root
+        depth = 0
+        while node is not None:
+            self._trace({
+                'action': visit_action,
+                'value': value,
+                'current_node': node.value
+            })
+            if value == node.value:
+                return node, depth
+            node = node.left if value < node.value else node.right
+            depth += 1
+        return None, depth
+
+    def _max_depth(self) -> int:
+        return math.floor(math.log(self.size + self.tombstones) / math.log(1 / self.alpha))
+
+    def _rebuild_scapegoat(self, path: List[TreeNode], inserted: TreeNode, value: int):
+        # Walks back up the insertion path; subtree sizes are counted as we
+        # go, which the rebuild of the scapegoat's subtree pays for.
+        child, child_size = inserted, 1
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            sibling = node.right if node.left is child else node.left
+            size = child_size + self._count(sibling) + 1
+            if child_size > self.alpha * size:
+                self._rebuild(node, path[index - 1] if index else None, value, 'scapegoat')
+                return
+            child, child_size = node, size
+
+    def _count(self, node: Optional[TreeNode]) -> int:
+        count = 0
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return count
+
+    def _rebuild(self, node: TreeNode, parent: Optional[TreeNode], value: Optional[int], reason: str):
+        values = []
+        dropped = 0
+        stack = []
+        current = node
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            if current.deleted:
+                dropped += 1
+            else:
+                values.append(current.value)
+            current = current.right
+
+        subtree = self._build_balanced(values, 0, len(values) - 1, parent)
+        if parent is None:
+            self.root = subtree
+        else:
+            if parent.left is node:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+            self.tombstones -= dropped
+            self._reshaped()
+
+        self._trace({
+            'action': 'rebuild',
+            'value': value,
+            'current_node': node.value,
+            'reason': reason,
+            'rebuilt_size': len(values)
+        })
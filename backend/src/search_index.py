@@ -0,0 +1,118 @@
+from array import array
+from typing import Iterable, List, Optional
+
+
+LAYOUTS = ('eytzinger', 'veb')
+
+
+class SearchIndex:
+    # Immutable array-laid-out copy of a tree's keys. Keys live in one typed
+    # buffer instead of separate TreeNode objects, so a lookup walks
+    # contiguous memory rather than chasing pointers.
+
+    def __init__(self, values: Iterable[int], layout: str = 'eytzinger'):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}', expected one of {', '.join(LAYOUTS)}")
+
+        self.layout = layout
+        ordered = list(values)
+        self._n = len(ordered)
+        self._keys, self._ranks = self._eytzinger(ordered)
+
+        if layout == 'veb':
+            self._to_veb()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def contains(self, value: int) -> bool:
+        slot = self._lower_bound(self._keys, value)
+        return slot is not None and self._keys[slot] == value
+
+    def rank(self, value: int) -> int:
+        # Number of keys strictly smaller than value.
+        slot = self._lower_bound(self._keys, value)
+        return self._n if slot is None else self._ranks[slot]
+
+    def select(self, k: int) -> int:
+        # k-th smallest key, counting from zero. Ranks are stored in the same
+        # layout as the keys, so the same descent finds the slot holding k.
+        if k < 0 or k >= self._n:
+            raise IndexError(f"Rank {k} out of range for {self._n} keys")
+        return self._keys[self._lower_bound(self._ranks, k)]
+
+    def _eytzinger(self, ordered: List[int]) -> tuple[array, array]:
+        # Slot i has children 2i and 2i + 1, slot 0 is unused. Filling the
+        # slots in inorder places the sorted keys in BFS order of a complete tree.
+        n = self._n
+        keys = array('q', [0]) * (n + 1)
+        ranks = array('q', [0]) * (n + 1)
+        stack = []
+        slot = 1
+        rank = 0
+        while stack or slot <= n:
+            while slot <= n:
+                stack.append(slot)
+                slot *= 2
+            slot = stack.pop()
+            keys[slot] = ordered[rank]
+            ranks[slot] = rank
+            rank += 1
+            slot = 2 * slot + 1
+        return keys, ranks
+
+    def _to_veb(self):
+        # Reorders the complete tree recursively into a top half and its
+        # bottom subtrees, so every subtree occupies a contiguous run of
+        # slots. Children can no longer be computed, so they are stored.
+        n = self._n
+        order: List[int] = []
+        _veb_order(1, n.bit_length(), n, order)
+
+        position = array('q', [0]) * (n + 1)
+        for slot, bfs in enumerate(order):
+            position[bfs] = slot
+
+        keys, ranks = array('q'), array('q')
+        self._left, self._right = array('q'), array('q')
+        for bfs in order:
+            keys.append(self._keys[bfs])
+            ranks.append(self._ranks[bfs])
+            self._left.append(position[2 * bfs] if 2 * bfs <= n else -1)
+            self._right.append(position[2 * bfs + 1] if 2 * bfs + 1 <= n else -1)
+        self._keys, self._ranks = keys, ranks
+
+    def _lower_bound(self, keys: array, value: int) -> Optional[int]:
+        # Slot of the smallest key >= value, or None when every key is smaller.
+        if self.layout == 'eytzinger':
+            n = self._n
+            slot = 1
+            while slot <= n:
+                slot = 2 * slot + (keys[slot] < value)
+            # Undo the trailing right turns plus the final left turn.
+            slot >>= (~slot & (slot + 1)).bit_length()
+            return slot or None
+
+        left, right = self._left, self._right
+        slot = 0 if self._n else -1
+        best = None
+        while slot != -1:
+            if keys[slot] < value:
+                slot = right[slot]
+            else:
+                best = slot
+                slot = left[slot]
+        return best
+
+
+def _veb_order(root: int, height: int, n: int, order: List[int]):
+    if root > n:
+        return
+    if height == 1:
+        order.append(root)
+        return
+    top = height // 2
+    _veb_order(root, top, n, order)
+    first = root << top
+    for subtree in range(first, first + (1 << top)):
+        _veb_order(subtree, height - top, n, order)
@@ -0,0 +1,149 @@
+from typing import Optional
+
+from binary_search_tree import BinarySearchTree, TreeNode
+
+
+class SplayTree(BinarySearchTree):
+    # Every access splays the touched node to the root, so frequently used
+    # keys stay near the top and skewed workloads pay a short search path.
+
+    def insert(self, value: int) -> bool:
+        inserted = super().insert(value)
+        node = self.root
+        while node is not None and node.value != value:
+            node = node.left if value < node.value else node.right
+        self._splay(node)
+        return inserted
+
+    def search(self, value: int) -> bool:
+        self.operation_steps = []
+        node, last, depth = self._descend(value, 'visit_node')
+
+        if node is None:
+            self._record_access(value, None)
+            self._trace({
+                'action': 'not_found',
+                'value': value
+            })
+            if last is not None:
+                self._splay(last)
+            return False
+
+        self._record_access(value, depth)
+        self._trace({
+            'action': 'found',
+            'value': value,
+            'current_node': node.value
+        })
+        self._splay(node)
+        return True
+
+    def delete(self, value: int) -> bool:
+        self.operation_steps = []
+        node, last, _ = self._descend(value, 'delete_visit')
+
+        if node is None:
+            self._trace({
+                'action': 'delete_not_found',
+                'value': value
+            })
+            if last is not None:
+                self._splay(last)
+            return False
+
+        self._splay(node)
+        left, right = node.left, node.right
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+
+        if left is None:
+            self.root = right
+        else:
+            # Splaying the largest key of the left subtree leaves it without
+            # a right child, which is where the right subtree is attached.
+            self.root = left
+            largest = left
+            while largest.right is not None:
+                largest = largest.right
+            self._splay(largest, trace=False)
+            largest.right = right
+            if right is not None:
+                right.parent = largest
+
+        self.size -= 1
+        self._trace({
+            'action': 'delete_join',
+            'value': value,
+            'replacement': self.root.value if self.root else None
+        })
+        return True
+
+    def _descend(self, value: int, visit_action: str) -> tuple[Optional[TreeNode], Optional[TreeNode], int]:
+        node = self.root
+        last = None
+        depth = 0
+        while node is not None:
+            self._trace({
+                'action': visit_action,
+                'value': value,
+                'current_node': node.value
+            })
+            if value == node.value:
+                return node, last, depth
+            last = node
+            node = node.left if value < node.value else node.right
+            depth += 1
+        return None, last, depth
+
+    def _rotate(self, node: TreeNode):
+        parent = node.parent
+        grandparent = parent.parent
+        if parent.left is node:
+            parent.left = node.right
+            if node.right is not None:
+                node.right.parent = parent
+            node.right = parent
+        else:
+            parent.right = node.left
+            if node.left is not None:
+                node.left.parent = parent
+            node.left = parent
+        parent.parent = node
+        node.parent = grandparent
+        if grandparent is not None:
+            if grandparent.left is parent:
+                grandparent.left = node
+            else:
+                grandparent.right = node
+
+    def _splay(self, node: Optional[TreeNode], trace: bool = True):
+        if node is None:
+            return
+        while node.parent is not None:
+            parent = node.parent
+            grandparent = parent.parent
+            if grandparent is None:
+                action = 'splay_zig'
+                self._rotate(node)
+            elif (grandparent.left is parent) == (parent.left is node):
+                action = 'splay_zig_zig'
+                self._rotate(parent)
+                self._rotate(node)
+            else:
+                action = 'splay_zig_zag'
+                self._rotate(node)
+                self._rotate(node)
+
+            # Rotations reorder nodes but keep the key set, so the array
+            # snapshot stays valid and the root is set without dropping it.
+            self._reshaped()
+            if node.parent is None:
+                self._root = node
+            if trace:
+                self._trace({
+                    'action': action,
+                    'value': node.value,
+                    'current_node': node.value
+                })
@@ -0,0 +1,263 @@
+import math
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+
+from binary_search_tree import BinarySearchTree
+
+
+# Trees smaller than this are analysed in-process; below it the cost of
+# starting workers outweighs the walk itself.
+PARALLEL_THRESHOLD = 200_000
+SUBTREES_PER_WORKER = 4
+
+# Column order of the shared-memory layout. Nodes are numbered in BFS order
+# and every column holds one int64 per node, -1 meaning "no node".
+COLUMNS = ('value', 'left', 'right', 'parent', 'deleted')
+MISSING_PARENT = -2
+
+# Workers come from a fork server, or are spawned where there is none,
+# because forking a multi-threaded server process is unsafe.
+POOL_CONTEXT = get_context('forkserver' if 'forkserver' in get_all_start_methods() else 'spawn')
+
+
+class SharedTreeSnapshot:
+    # BFS-numbered, column-per-field copy of a tree in a shared-memory block,
+    # so worker processes can read it without pickling the tree.
+
+    def __init__(self, tree: BinarySearchTree):
+        try:
+            columns, self.level_starts = _export_columns(tree)
+        except OverflowError:
+            raise ValueError("Tree statistics need keys that fit in a signed 64-bit integer") from None
+        self.columns: Dict[str, array] = dict(zip(COLUMNS, columns))
+        self.size = len(columns[0])
+        self.shm = SharedMemory(create=True, size=max(1, self.size * len(COLUMNS) * 8))
+        for index, column in enumerate(columns):
+            start = index * self.size * 8
+            self.shm.buf[start:start + self.size * 8] = memoryview(column).cast('B')
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedTreeSnapshot':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _export_columns(tree: BinarySearchTree) -> Tuple[List[array], List[int]]:
+    values, lefts, rights, parents, deleted = (array('q') for _ in COLUMNS)
+    level_starts = [0]
+    if tree.root is None:
+        return [values, lefts, rights, parents, deleted], level_starts
+
+    order = [tree.root]
+    numbering = {id(tree.root): 0}
+    unresolved = []
+    position = 0
+    while position < len(order):
+        level_end = len(order)
+        while position < level_end:
+            node = order[position]
+            values.append(node.value)
+            deleted.append(1 if node.deleted else 0)
+            if node.parent is None:
+                parents.append(-1)
+            elif id(node.parent) in numbering:
+                parents.append(numbering[id(node.parent)])
+            else:
+                parents.append(MISSING_PARENT)
+                unresolved.append(position)
+            for child, column in ((node.left, lefts), (node.right, rights)):
+                if child is None:
+                    column.append(-1)
+                else:
+                    numbering[id(child)] = len(order)
+                    column.append(len(order))
+                    order.append(child)
+            position += 1
+        level_starts.append(level_end)
+
+    # A stale parent pointer may reference a node numbered later, or one
+    # that is no longer in the tree at all.
+    for index in unresolved:
+        parents[index] = numbering.get(id(order[index].parent), MISSING_PARENT)
+    return [values, lefts, rights, parents, deleted], level_starts
+
+
+# Summary of one subtree: (height, min_key, max_key, keys) where keys is None
+# when the subtree has no live key, else (first, last, gap_count, gap_total,
+# gap_min, gap_max) over its live keys in order.
+Summary = Tuple[int, int, int, Optional[Tuple[int, int, int, int, float, float]]]
+
+
+def _concat(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    gap = b[0] - a[1]
+    return (a[0], b[1], a[2] + b[2] + 1, a[3] + b[3] + gap,
+            min(a[4], b[4], gap), max(a[5], b[5], gap))
+
+
+def _summarize(columns: Sequence[Sequence[int]], root: int, root_depth: int,
+               known: Dict[int, Summary]) -> Tuple[Summary, Dict[str, Any]]:
+    values, lefts, rights, parents, deleted = columns
+    depth_histogram: Counter = Counter()
+    balance_histogram: Counter = Counter()
+    violations = 0
+    parent_mismatches = 0
+    nodes = 0
+
+    results: List[Optional[Summary]] = []
+    stack = [(root, root_depth, False)]
+    while stack:
+        index, depth, expanded = stack.pop()
+        if index == -1:
+            results.append(None)
+            continue
+        if index in known:
+            results.append(known[index])
+            continue
+        if not expanded:
+            stack.append((index, depth, True))
+            stack.append((rights[index], depth + 1, False))
+            stack.append((lefts[index], depth + 1, False))
+            continue
+
+        right, left = results.pop(), results.pop()
+        value = values[index]
+        nodes += 1
+        depth_histogram[depth] += 1
+        left_height = left[0] if left else -1
+        right_height = right[0] if right else -1
+        balance_histogram[left_height - right_height] += 1
+
+        if (left and left[2] >= value) or (right and right[1] <= value):
+            violations += 1
+        for child in (lefts[index], rights[index]):
+            if child != -1 and parents[child] != index:
+                parent_mismatches += 1
+
+        own = None if deleted[index] else (value, value, 0, 0, math.inf, -math.inf)
+        keys = _concat(_concat(left[3] if left else None, own), right[3] if right else None)
+        results.append((
+            1 + max(left_height, right_height),
+            min(value, left[1] if left else value, right[1] if right else value),
+            max(value, left[2] if left else value, right[2] if right else value),
+            keys
+        ))
+
+    return results[0], {
+        'depth_histogram': depth_histogram,
+        'balance_histogram': balance_histogram,
+        'violations': violations,
+        'parent_mismatches': parent_mismatches,
+        'nodes': nodes
+    }
+
+
+_worker_shm: Optional[SharedMemory] = None
+_worker_columns: Optional[List[memoryview]] = None
+
+
+def _attach_worker(name: str, size: int):
+    global _worker_shm, _worker_columns
+    _worker_shm = SharedMemory(name=name)
+    view = _worker_shm.buf.cast('q')
+    _worker_columns = [view[index * size:(index + 1) * size] for index in range(len(COLUMNS))]
+
+
+def _summarize_subtree(root: int, depth: int) -> Tuple[int, Summary, Dict[str, Any]]:
+    summary, metrics = _summarize(_worker_columns, root, depth, {})
+    return root, summary, metrics
+
+
+def tree_stats(tree: BinarySearchTree, workers: Optional[int] = None,
+               parallel_threshold: int = PARALLEL_THRESHOLD) -> Dict[str, Any]:
+    with SharedTreeSnapshot(tree) as snapshot:
+        return snapshot_stats(snapshot, workers, parallel_threshold)
+
+
+def snapshot_stats(snapshot: SharedTreeSnapshot, workers: Optional[int] = None,
+                   parallel_threshold: int = PARALLEL_THRESHOLD) -> Dict[str, Any]:
+    # Reads only the snapshot, so it can run off the thread that owns the
+    # tree while that thread keeps changing it.
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    columns = [snapshot.columns[name] for name in COLUMNS]
+    if snapshot.size == 0:
+        return _report(None, [], 0, 0)
+
+    known: Dict[int, Summary] = {}
+    partials = []
+    frontier = []
+    if workers > 1 and snapshot.size >= parallel_threshold:
+        frontier = _frontier(snapshot.level_starts, workers * SUBTREES_PER_WORKER)
+
+    if frontier:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT, initializer=_attach_worker,
+                                 initargs=(snapshot.shm.name, snapshot.size)) as pool:
+            futures = [pool.submit(_summarize_subtree, root, depth) for root, depth in frontier]
+            for future in futures:
+                root, summary, metrics = future.result()
+                known[root] = summary
+                partials.append(metrics)
+
+    summary, metrics = _summarize(columns, 0, 0, known)
+    partials.append(metrics)
+    root_mismatch = 1 if snapshot.columns['parent'][0] != -1 else 0
+    return _report(summary, partials, root_mismatch, len(frontier))
+
+
+def _frontier(level_starts: List[int], target: int) -> List[Tuple[int, int]]:
+    # The first BFS level wide enough to keep every worker busy; each of its
+    # nodes roots one subtree task.
+    for depth in range(1, len(level_starts) - 1):
+        start, end = level_starts[depth], level_starts[depth + 1]
+        if end - start >= target:
+            return [(index, depth) for index in range(start, end)]
+    return []
+
+
+def _report(summary: Optional[Summary], partials: List[Dict[str, Any]],
+            root_mismatch: int, subtrees: int) -> Dict[str, Any]:
+    depth_histogram: Counter = Counter()
+    balance_histogram: Counter = Counter()
+    for metrics in partials:
+        depth_histogram.update(metrics['depth_histogram'])
+        balance_histogram.update(metrics['balance_histogram'])
+    violations = sum(metrics['violations'] for metrics in partials)
+    parent_mismatches = root_mismatch + sum(metrics['parent_mismatches'] for metrics in partials)
+    nodes = sum(metrics['nodes'] for metrics in partials)
+    keys = summary[3] if summary else None
+
+    return {
+        'nodes': nodes,
+        'height': summary[0] if summary else -1,
+        'bst_valid': violations == 0,
+        'bst_violations': violations,
+        'parent_pointers_consistent': parent_mismatches == 0,
+        'parent_mismatches': parent_mismatches,
+        'average_depth': sum(d * c for d, c in depth_histogram.items()) / nodes if nodes else 0.0,
+        'depth_histogram': dict(sorted(depth_histogram.items())),
+        'balance_factor_histogram': dict(sorted(balance_histogram.items())),
+        'key_gaps': {
+            'count': keys[2] if keys else 0,
+            'min': keys[4] if keys and keys[2] else None,
+            'max': keys[5] if keys and keys[2] else None,
+            'mean': keys[3] / keys[2] if keys and keys[2] else None
+        },
+        'subtrees': subtrees
+    }
@@ -0,0 +1,118 @@
+import math
+import random
+from typing import Optional, List
+
+from binary_search_tree import BinarySearchTree, TreeNode
+
+
+DISTRIBUTIONS = ('uniform', 'sorted', 'reverse', 'zigzag', 'clustered')
+SHAPES = ('balanced', 'degenerate', 'random')
+MAX_GENERATED_SIZE = 10_000_000
+
+
+def generate_keys(size: int, seed: Optional[int] = None, distribution: str = 'uniform') -> List[int]:
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}', expected one of {', '.join(DISTRIBUTIONS)}")
+    if size < 0 or size > MAX_GENERATED_SIZE:
+        raise ValueError(f"Size must be between 0 and {MAX_GENERATED_SIZE}")
+
+    rng = random.Random(seed)
+
+    if distribution == 'clustered':
+        return _clustered_keys(size, rng)
+
+    # Keys are drawn without replacement so the tree never rejects a duplicate.
+    keys = rng.sample(range(1, max(10 * size, 20) + 1), size)
+    if distribution == 'uniform':
+        return keys
+
+    keys.sort()
+    if distribution == 'sorted':
+        return keys
+    if distribution == 'reverse':
+        keys.reverse()
+        return keys
+
+    # zigzag alternates between the smallest and largest remaining key.
+    half = (size + 1) // 2
+    zigzag = [0] * size
+    zigzag[0::2] = keys[:half]
+    zigzag[1::2] = keys[half:][::-1]
+    return zigzag
+
+
+def _clustered_keys(size: int, rng: random.Random) -> List[int]:
+    clusters = max(1, math.isqrt(size))
+    base, extra = divmod(size, clusters)
+    keys = []
+    start = 1
+    for index in range(clusters):
+        length = base + (1 if index < extra else 0)
+        start += rng.randint(length, 10 * length) if length else 0
+        keys.extend(range(start, start + length))
+        start += length
+    rng.shuffle(keys)
+    return keys
+
+
+def generate_tree(size: int, seed: Optional[int] = None, distribution: str = 'uniform',
+                  shape: str = 'random', tree: Optional[BinarySearchTree] = None) -> BinarySearchTree:
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape '{shape}', expected one of {', '.join(SHAPES)}")
+
+    keys = generate_keys(size, seed, distribution)
+    if tree is None:
+        tree = BinarySearchTree()
+    tree.clear()
+
+    # Nodes are linked directly instead of going through insert(), which
+    # would snapshot the whole tree on every step.
+    if shape == 'balanced':
+        keys.sort()
+        tree.build_from_sorted(keys)
+    elif shape == 'degenerate':
+        keys.sort()
+        tree.adopt(_build_chain(keys), len(keys))
+    else:
+        tree.adopt(_build_insertion_order(keys), len(keys))
+
+    return tree
+
+
+def _build_chain(keys: List[int]) -> Optional[TreeNode]:
+    root = None
+    tail = None
+    for key in keys:
+        node = TreeNode(key, parent=tail)
+        if tail is None:
+            root = node
+        else:
+            tail.right = node
+        tail = node
+    return root
+
+
+def _build_insertion_order(keys: List[int]) -> Optional[TreeNode]:
+    # Inserting keys one by one yields the Cartesian tree ordered by key with
+    # the insertion index as a min-heap priority, which a stack builds in a
+    # single pass over the keys in sorted order.
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    nodes: List[TreeNode] = []
+    ranks: List[int] = []
+
+    for rank in order:
+        node = TreeNode(keys[rank])
+        last = None
+        while ranks and ranks[-1] > rank:
+            ranks.pop()
+            last = nodes.pop()
+        if last is not None:
+            node.left = last
+            last.parent = node
+        if nodes:
+            nodes[-1].right = node
+            node.parent = nodes[-1]
+        nodes.append(node)
+        ranks.append(rank)
+
+    return nodes[0] if nodes else None
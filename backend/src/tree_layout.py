@@ -0,0 +1,49 @@
+from array import array
+from typing import Dict
+
+from binary_search_tree import BinarySearchTree
+
+FIELDS = ('value', 'parent', 'depth', 'rank', 'deleted')
+
+
+def node_layout(tree: BinarySearchTree) -> Dict[str, array]:
+    # One row per node in BFS order across the FIELDS columns, so every
+    # parent precedes its children and a client can place nodes page by
+    # page: depth gives the row and the inorder rank the column. Typed
+    # columns keep a million-node layout at 40 MB.
+    values, parents, depths, deleted, lefts, rights = (array('q') for _ in range(6))
+
+    queue = []
+    if tree.root is not None:
+        queue.append(tree.root)
+        parents.append(-1)
+        depths.append(0)
+    for index, node in enumerate(queue):
+        values.append(node.value)
+        deleted.append(1 if node.deleted else 0)
+        for child, links in ((node.left, lefts), (node.right, rights)):
+            if child is None:
+                links.append(-1)
+            else:
+                links.append(len(queue))
+                queue.append(child)
+                parents.append(index)
+                depths.append(depths[index] + 1)
+        queue[index] = None
+
+    # Ranks come from an inorder walk over the child indices, which avoids
+    # keying a dict by every node.
+    ranks = array('q', bytes(8 * len(values)))
+    stack = []
+    index = 0 if values else -1
+    rank = 0
+    while stack or index != -1:
+        while index != -1:
+            stack.append(index)
+            index = lefts[index]
+        index = stack.pop()
+        ranks[index] = rank
+        rank += 1
+        index = rights[index]
+
+    return dict(zip(FIELDS, (values, parents, depths, ranks, deleted)))
@@ -1 +1,14 @@
 # Test package initialization
+
+
+def assert_parent_pointers(tree):
+    """Check the root has no parent and every child links back to its parent"""
+    stack = [tree.root] if tree.root is not None else []
+    if tree.root is not None:
+        assert tree.root.parent is None
+    while stack:
+        node = stack.pop()
+        for child in (node.left, node.right):
+            if child is not None:
+                assert child.parent is node
+                stack.append(child)
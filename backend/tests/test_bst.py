@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from binary_search_tree import BinarySearchTree, TreeNode
+from tests import assert_parent_pointers
 
 
 class TestTreeNode:
@@ -251,6 +252,69 @@ class TestBinarySearchTree:
         assert result['size'] == len(values)
         assert result['is_empty'] is False
     
+    def test_delete_keeps_parent_pointers(self):
+        """Test deletions relink parent pointers of moved nodes"""
+        values = [50, 25, 75, 12, 37, 62, 87, 6, 18, 31, 43]
+        for value in values:
+            self.bst.insert(value)
+        
+        for value in [25, 12, 50]:
+            self.bst.delete(value)
+        
+        assert_parent_pointers(self.bst)
+    
+    def test_access_stats(self):
+        """Test searches record access counts and hit depths"""
+        for value in [10, 5, 15, 3]:
+            self.bst.insert(value)
+        
+        self.bst.search(10)
+        self.bst.search(3)
+        self.bst.search(3)
+        self.bst.search(99)
+        
+        stats = self.bst.access_stats()
+        assert stats['searches'] == 4
+        assert stats['hits'] == 3
+        assert stats['misses'] == 1
+        assert stats['hit_depth_distribution'] == {0: 1, 2: 2}
+        assert stats['average_hit_depth'] == pytest.approx(4 / 3)
+        assert stats['top_keys'][0] == {'value': 3, 'count': 2}
+        
+        self.bst.reset_access_stats()
+        assert self.bst.access_stats()['searches'] == 0
+    
+    def test_untraced_lookup(self):
+        """Test snapshot lookups are counted apart from traced searches"""
+        for value in [10, 5, 15]:
+            self.bst.insert(value)
+        
+        assert self.bst.lookup(5) is True
+        assert self.bst.lookup(7) is False
+        assert self.bst.get_operation_steps()[-1]['action'] == 'insert_right'
+        
+        stats = self.bst.access_stats()
+        assert stats['untraced_lookups'] == 2
+        assert stats['searches'] == 0
+        
+        self.bst.reset_access_stats()
+        assert self.bst.access_stats()['untraced_lookups'] == 0
+    
+    def test_version_tracks_changes(self):
+        """Test only reshaping operations give the tree a new version"""
+        for value in [10, 5, 15]:
+            self.bst.insert(value)
+        version = self.bst.version
+        
+        self.bst.insert(10)
+        self.bst.search(5)
+        self.bst.delete(99)
+        assert self.bst.version == version
+        
+        self.bst.delete(5)
+        assert self.bst.version != version
+        assert BinarySearchTree().version != self.bst.version
+    
     def test_operation_steps_tracking(self):
         """Test operation steps tracking for animations"""
         # Insert operation should track steps
@@ -291,5 +355,74 @@ class TestBinarySearchTree:
             assert self.bst.search(value) is True
 
 
+class TestSetOperations:
+    """Test cases for set operations, split and join"""
+    
+    def build(self, values):
+        tree = BinarySearchTree()
+        for value in values:
+            tree.insert(value)
+        return tree
+    
+    def test_union(self):
+        """Test union keeps every value once and is balanced"""
+        result = self.build([1, 2, 3, 4, 5]).union(self.build([4, 5, 6, 7]))
+        assert result.inorder_traversal() == [1, 2, 3, 4, 5, 6, 7]
+        assert result.size == 7
+        assert result.height() == 2
+    
+    def test_intersection(self):
+        """Test intersection keeps shared values only"""
+        result = self.build([10, 5, 15, 3]).intersection(self.build([3, 15, 20]))
+        assert result.inorder_traversal() == [3, 15]
+        assert result.size == 2
+    
+    def test_difference(self):
+        """Test difference removes values found in the other tree"""
+        result = self.build([10, 5, 15, 3]).difference(self.build([3, 15, 20]))
+        assert result.inorder_traversal() == [5, 10]
+        assert result.size == 2
+    
+    def test_operations_with_empty_tree(self):
+        """Test set operations against an empty tree"""
+        tree = self.build([2, 1, 3])
+        empty = BinarySearchTree()
+        assert tree.union(empty).inorder_traversal() == [1, 2, 3]
+        assert tree.intersection(empty).is_empty() is True
+        assert tree.difference(empty).inorder_traversal() == [1, 2, 3]
+        assert empty.difference(tree).is_empty() is True
+    
+    def test_merge_in_place(self):
+        """Test merge replaces the tree with the union"""
+        tree = self.build([1, 2, 3, 4])
+        tree.merge(self.build([0, 4, 8]))
+        assert tree.inorder_traversal() == [0, 1, 2, 3, 4, 8]
+        assert tree.size == 6
+    
+    def test_split(self):
+        """Test split partitions values around the key"""
+        tree = self.build([50, 25, 75, 12, 37, 62, 87])
+        smaller, larger = tree.split(50)
+        assert smaller.inorder_traversal() == [12, 25, 37]
+        assert larger.inorder_traversal() == [50, 62, 75, 87]
+        assert (smaller.size, larger.size) == (3, 4)
+        assert tree.is_empty() is True
+    
+    def test_split_then_join_restores_values(self):
+        """Test joining split halves gives back the original values"""
+        values = [50, 25, 75, 12, 37, 62, 87, 6, 18, 31, 43]
+        smaller, larger = self.build(values).split(40)
+        smaller.join(larger)
+        assert smaller.inorder_traversal() == sorted(values)
+        assert smaller.size == len(values)
+        assert larger.is_empty() is True
+        assert smaller.root.parent is None
+    
+    def test_join_rejects_overlapping_keys(self):
+        """Test join requires the other tree's keys to be greater"""
+        with pytest.raises(ValueError):
+            self.build([1, 5]).join(self.build([3, 9]))
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
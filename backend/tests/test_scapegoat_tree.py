@@ -0,0 +1,162 @@
+"""
+Test suite for the scapegoat tree mode with lazy deletion
+"""
+
+import math
+import pytest
+import random
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree, MAX_SERIALIZED_NODES
+from scapegoat_tree import ScapegoatTree
+from tree_generator import generate_tree
+from tests import assert_parent_pointers
+
+
+class TestScapegoatTree:
+    """Test cases for ScapegoatTree class"""
+
+    def setup_method(self):
+        """Set up a scapegoat tree with a few values"""
+        self.tree = ScapegoatTree()
+        for value in [50, 25, 75, 12, 37, 62, 87]:
+            self.tree.insert(value)
+
+    def test_delete_marks_tombstone(self):
+        """Test deletion leaves the node in place as a tombstone"""
+        assert self.tree.delete(25) is True
+        assert self.tree.size == 6
+        assert self.tree.tombstones == 1
+        assert self.tree.root.left.value == 25
+        assert self.tree.root.left.deleted is True
+        assert self.tree.search(25) is False
+        assert 25 not in self.tree.inorder_traversal()
+        assert self.tree.delete(25) is False
+
+    def test_tombstone_in_operation_steps_and_dict(self):
+        """Test tombstones are traced and serialized"""
+        self.tree.delete(12)
+        actions = [step['action'] for step in self.tree.get_operation_steps()]
+        assert actions[-1] == 'delete_tombstone'
+        assert self.tree.to_dict()['root']['left']['left'] == {
+            'value': 12, 'left': None, 'right': None, 'deleted': True
+        }
+
+    def test_insert_revives_tombstone(self):
+        """Test inserting a deleted value clears its tombstone"""
+        self.tree.delete(37)
+        assert self.tree.insert(37) is True
+        assert self.tree.tombstones == 0
+        assert self.tree.size == 7
+        assert self.tree.search(37) is True
+        assert self.tree.insert(37) is False
+
+    def test_tombstone_threshold_triggers_rebuild(self):
+        """Test passing the tombstone ratio rebuilds the whole tree"""
+        for value in [12, 37, 62]:
+            self.tree.delete(value)
+        assert self.tree.tombstones == 3
+        self.tree.delete(87)
+
+        assert self.tree.tombstones == 0
+        assert self.tree.inorder_traversal() == [25, 50, 75]
+        assert self.tree.height() == 1
+        assert self.tree.get_operation_steps()[-1]['action'] == 'rebuild'
+        assert self.tree.get_operation_steps()[-1]['reason'] == 'tombstones'
+        assert_parent_pointers(self.tree)
+
+    def test_sorted_inserts_stay_shallow(self):
+        """Test sorted inserts trigger scapegoat rebuilds instead of a chain"""
+        tree = ScapegoatTree()
+        for value in range(300):
+            tree.insert(value)
+        assert tree.size == 300
+        assert tree.height() <= math.floor(math.log(300) / math.log(1 / tree.alpha))
+        assert tree.inorder_traversal() == list(range(300))
+        assert_parent_pointers(tree)
+
+    def test_rebuild_traced(self):
+        """Test scapegoat rebuilds are exposed as operation steps"""
+        tree = ScapegoatTree()
+        rebuilds = []
+        for value in range(20):
+            tree.insert(value)
+            rebuilds.extend(step for step in tree.get_operation_steps() if step['action'] == 'rebuild')
+        assert rebuilds
+        assert all(step['reason'] == 'scapegoat' for step in rebuilds)
+
+    def test_large_tree_steps_skip_tree_state(self):
+        """Test deletes on large trees trace only the search path"""
+        tree = generate_tree(MAX_SERIALIZED_NODES * 4, seed=6, shape='balanced', tree=ScapegoatTree())
+        value = tree.inorder_traversal()[100]
+        assert tree.delete(value) is True
+
+        steps = tree.get_operation_steps()
+        assert len(steps) <= tree.height() + 2
+        assert steps[-1]['action'] == 'delete_tombstone'
+        assert all('tree_state' not in step for step in steps)
+
+        self.tree.delete(12)
+        assert all('tree_state' in step for step in self.tree.get_operation_steps())
+
+    def test_adopting_degenerate_tree_rebuilds(self):
+        """Test a chain handed over from another mode is rebuilt once"""
+        chain = generate_tree(3000, seed=3, shape='degenerate')
+        keys = chain.inorder_traversal()
+        tree = ScapegoatTree()
+        tree.adopt(chain.root, chain.size)
+
+        assert tree.height() <= tree._max_depth()
+        assert tree.get_operation_steps()[-1]['reason'] == 'adopt'
+        assert tree.inorder_traversal() == keys
+        assert_parent_pointers(tree)
+
+        tree.insert(keys[-1] + 1)
+        assert tree.height() <= tree._max_depth()
+
+    def test_adopting_shallow_tree_keeps_shape(self):
+        """Test a tree already within the depth bound is taken as is"""
+        static = BinarySearchTree()
+        for value in [50, 25, 75]:
+            static.insert(value)
+        tree = ScapegoatTree()
+        tree.adopt(static.root, static.size)
+        assert tree.root is static.root
+        assert tree.get_operation_steps() == []
+
+    def test_invalid_thresholds(self):
+        """Test alpha and tombstone ratio are validated"""
+        with pytest.raises(ValueError):
+            ScapegoatTree(alpha=0.5)
+        with pytest.raises(ValueError):
+            ScapegoatTree(tombstone_ratio=1)
+
+    def test_randomized_against_static_tree(self):
+        """Test contents match a static tree under random churn"""
+        rng = random.Random(21)
+        tree, static = ScapegoatTree(alpha=0.6, tombstone_ratio=0.3), BinarySearchTree()
+        for _ in range(1000):
+            value = rng.randint(0, 100)
+            operation = rng.choice(['insert', 'insert', 'delete', 'search'])
+            assert getattr(tree, operation)(value) == getattr(static, operation)(value)
+            assert tree.size == static.size
+        assert tree.inorder_traversal() == static.inorder_traversal()
+        assert tree.snapshot().rank(50) == static.snapshot().rank(50)
+        assert_parent_pointers(tree)
+
+    def test_split_and_join_compact_first(self):
+        """Test split and join never carry tombstones across"""
+        self.tree.delete(62)
+        smaller, larger = self.tree.split(60)
+        assert larger.inorder_traversal() == [75, 87]
+        assert larger.size == 2
+        smaller.join(larger)
+        assert smaller.inorder_traversal() == [12, 25, 37, 50, 75, 87]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
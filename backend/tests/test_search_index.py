@@ -0,0 +1,86 @@
+"""
+Test suite for the array-laid-out search index
+"""
+
+import bisect
+import pytest
+import random
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree
+from search_index import SearchIndex, LAYOUTS
+
+
+class TestSearchIndex:
+    """Test cases for SearchIndex class"""
+
+    @pytest.mark.parametrize("layout", LAYOUTS)
+    @pytest.mark.parametrize("size", [0, 1, 2, 7, 8, 100, 1000])
+    def test_matches_sorted_list(self, layout, size):
+        """Test contains, rank and select agree with a sorted list"""
+        values = sorted(random.Random(size).sample(range(0, 5 * size + 10, 2), size))
+        index = SearchIndex(values, layout)
+        assert len(index) == size
+
+        for probe in range(-1, 5 * size + 12):
+            assert index.contains(probe) is (probe in values)
+            assert index.rank(probe) == bisect.bisect_left(values, probe)
+        for k, value in enumerate(values):
+            assert index.select(k) == value
+
+    def test_select_out_of_range(self):
+        """Test select rejects ranks outside the index"""
+        index = SearchIndex([1, 2, 3])
+        with pytest.raises(IndexError):
+            index.select(3)
+        with pytest.raises(IndexError):
+            index.select(-1)
+
+    def test_unknown_layout(self):
+        """Test unknown layouts are rejected"""
+        with pytest.raises(ValueError):
+            SearchIndex([1, 2, 3], 'btree')
+
+
+class TestTreeSnapshot:
+    """Test cases for BinarySearchTree.snapshot"""
+
+    def setup_method(self):
+        """Set up a tree with a few values"""
+        self.bst = BinarySearchTree()
+        for value in [10, 5, 15, 3, 7]:
+            self.bst.insert(value)
+
+    def test_snapshot_is_cached(self):
+        """Test repeated reads reuse the same snapshot"""
+        snapshot = self.bst.snapshot()
+        self.bst.search(7)
+        self.bst.insert(10)
+        assert self.bst.snapshot() is snapshot
+
+    def test_snapshot_rebuilt_after_mutation(self):
+        """Test mutations invalidate the snapshot"""
+        snapshot = self.bst.snapshot()
+        self.bst.insert(12)
+        assert self.bst.snapshot() is not snapshot
+        assert self.bst.snapshot().contains(12) is True
+
+        self.bst.delete(5)
+        assert self.bst.snapshot().contains(5) is False
+
+        self.bst.clear()
+        assert len(self.bst.snapshot()) == 0
+
+    def test_snapshot_layouts(self):
+        """Test switching layout rebuilds the snapshot"""
+        assert self.bst.snapshot('veb').layout == 'veb'
+        assert self.bst.snapshot('veb').select(2) == 7
+        assert self.bst.snapshot().layout == 'eytzinger'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,116 @@
+"""
+Test suite for the splay tree mode
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree
+from splay_tree import SplayTree
+from tests import assert_parent_pointers
+
+
+def assert_valid(tree):
+    """Check ordering, size and parent pointers of every node"""
+    assert tree.inorder_traversal() == sorted(tree.inorder_traversal())
+    assert len(tree.inorder_traversal()) == tree.size
+    assert_parent_pointers(tree)
+
+
+class TestSplayTree:
+    """Test cases for SplayTree class"""
+
+    def setup_method(self):
+        """Set up a splay tree with a few values"""
+        self.tree = SplayTree()
+        for value in [50, 25, 75, 12, 37, 62, 87]:
+            self.tree.insert(value)
+
+    def test_insert_moves_value_to_root(self):
+        """Test inserted values are splayed to the root"""
+        self.tree.insert(40)
+        assert self.tree.root.value == 40
+        assert self.tree.size == 8
+        assert_valid(self.tree)
+
+    def test_search_moves_value_to_root(self):
+        """Test searched values are splayed to the root"""
+        assert self.tree.search(12) is True
+        assert self.tree.root.value == 12
+        assert_valid(self.tree)
+
+    def test_search_missing_splays_last_visited(self):
+        """Test a miss splays the last node on the search path"""
+        assert self.tree.search(13) is False
+        assert self.tree.root.value == 25
+        assert_valid(self.tree)
+
+    def test_splay_keeps_snapshot(self):
+        """Test rotations keep the key snapshot and only move the version"""
+        snapshot = self.tree.snapshot()
+        version = self.tree.version
+        self.tree.search(12)
+        assert self.tree.snapshot() is snapshot
+        assert self.tree.version != version
+
+        version = self.tree.version
+        self.tree.search(12)
+        assert self.tree.version == version
+
+        self.tree.insert(13)
+        assert self.tree.snapshot() is not snapshot
+
+    def test_delete(self):
+        """Test deleting values keeps the tree valid"""
+        for value in [50, 12, 87, 99]:
+            self.tree.delete(value)
+        assert self.tree.size == 4
+        assert self.tree.inorder_traversal() == [25, 37, 62, 75]
+        assert_valid(self.tree)
+
+    def test_operation_steps_include_splay(self):
+        """Test splay rotations are traced"""
+        self.tree.search(12)
+        actions = [step['action'] for step in self.tree.get_operation_steps()]
+        assert 'found' in actions
+        assert any(action.startswith('splay_') for action in actions)
+
+    def test_randomized_against_static_tree(self):
+        """Test splay tree contents match a static tree under random operations"""
+        rng = random.Random(11)
+        static = BinarySearchTree()
+        for value in self.tree.inorder_traversal():
+            static.insert(value)
+        for _ in range(500):
+            value = rng.randint(0, 100)
+            operation = rng.choice(['insert', 'delete', 'search'])
+            assert getattr(self.tree, operation)(value) == getattr(static, operation)(value)
+        assert self.tree.inorder_traversal() == static.inorder_traversal()
+        assert_valid(self.tree)
+
+    def test_skewed_access_reduces_hit_depth(self):
+        """Test hot keys are found closer to the root than in a static tree"""
+        keys = list(range(1, 256))
+        random.Random(3).shuffle(keys)
+        static, splay = BinarySearchTree(), SplayTree()
+        for key in keys:
+            static.insert(key)
+            splay.insert(key)
+
+        hot = keys[-5:]
+        workload = [hot[i % len(hot)] for i in range(500)]
+        for key in workload:
+            static.search(key)
+            splay.search(key)
+
+        assert splay.access_stats()['average_hit_depth'] < static.access_stats()['average_hit_depth']
+        assert splay.access_stats()['hits'] == 500
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
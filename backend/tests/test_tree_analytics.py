@@ -0,0 +1,97 @@
+"""
+Test suite for tree analytics and invariant validation
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree, TreeNode
+from scapegoat_tree import ScapegoatTree
+from tree_analytics import tree_stats
+from tree_generator import generate_tree
+
+
+class TestTreeStats:
+    """Test cases for tree_stats"""
+
+    def setup_method(self):
+        """Set up a small tree with known shape"""
+        self.bst = BinarySearchTree()
+        for value in [10, 5, 15, 3, 7, 20]:
+            self.bst.insert(value)
+
+    def test_empty_tree(self):
+        """Test statistics of an empty tree"""
+        stats = tree_stats(BinarySearchTree(), workers=1)
+        assert stats['nodes'] == 0
+        assert stats['height'] == -1
+        assert stats['bst_valid'] is True
+        assert stats['key_gaps']['count'] == 0
+
+    def test_small_tree(self):
+        """Test histograms and key gaps of a known tree"""
+        stats = tree_stats(self.bst, workers=1)
+        assert stats['nodes'] == 6
+        assert stats['height'] == 2
+        assert stats['bst_valid'] is True
+        assert stats['parent_pointers_consistent'] is True
+        assert stats['depth_histogram'] == {0: 1, 1: 2, 2: 3}
+        assert stats['balance_factor_histogram'] == {-1: 1, 0: 5}
+        assert stats['key_gaps'] == {'count': 5, 'min': 2, 'max': 5, 'mean': 17 / 5}
+
+    def test_detects_invariant_violation(self):
+        """Test a misplaced key is reported"""
+        self.bst.root.left.right.value = 12
+        stats = tree_stats(self.bst, workers=1)
+        assert stats['bst_valid'] is False
+        assert stats['bst_violations'] == 1
+
+    def test_detects_parent_mismatch(self):
+        """Test stale parent pointers are reported"""
+        self.bst.root.left.left.parent = self.bst.root.right
+        self.bst.root.right.right.parent = TreeNode(99)
+        stats = tree_stats(self.bst, workers=1)
+        assert stats['parent_pointers_consistent'] is False
+        assert stats['parent_mismatches'] == 2
+
+    def test_tombstones_skipped_in_key_gaps(self):
+        """Test deleted keys count as nodes but not as gap endpoints"""
+        tree = ScapegoatTree()
+        for value in [10, 5, 15, 3, 7, 20]:
+            tree.insert(value)
+        tree.delete(7)
+        stats = tree_stats(tree, workers=1)
+        assert stats['nodes'] == 6
+        assert stats['key_gaps']['count'] == 4
+        assert stats['key_gaps']['max'] == 5
+
+    @pytest.mark.parametrize("shape", ['random', 'balanced', 'degenerate'])
+    def test_parallel_matches_sequential(self, shape):
+        """Test the process pool gives the same result as one walk"""
+        tree = generate_tree(3000, seed=4, shape=shape)
+        sequential = tree_stats(tree, workers=1)
+        parallel = tree_stats(tree, workers=2, parallel_threshold=0)
+        if shape != 'degenerate':
+            assert parallel['subtrees'] > 0
+        sequential.pop('subtrees')
+        parallel.pop('subtrees')
+        assert parallel == sequential
+
+    def test_invalid_workers(self):
+        """Test non-positive worker counts are rejected"""
+        with pytest.raises(ValueError):
+            tree_stats(self.bst, workers=0)
+
+    def test_keys_beyond_64_bits(self):
+        """Test keys the typed columns cannot hold are rejected"""
+        self.bst.insert(2**70)
+        with pytest.raises(ValueError):
+            tree_stats(self.bst)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,128 @@
+"""
+Test suite for the synthetic tree generator
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree
+from tree_generator import generate_keys, generate_tree, DISTRIBUTIONS
+from tests import assert_parent_pointers
+
+
+def insert_all(values):
+    tree = BinarySearchTree()
+    for value in values:
+        tree.insert(value)
+    return tree
+
+
+class TestGenerateKeys:
+    """Test cases for key generation"""
+
+    @pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+    def test_keys_are_distinct(self, distribution):
+        """Test every distribution yields the requested number of distinct keys"""
+        keys = generate_keys(200, seed=1, distribution=distribution)
+        assert len(keys) == 200
+        assert len(set(keys)) == 200
+
+    def test_same_seed_is_reproducible(self):
+        """Test a seed always produces the same keys"""
+        assert generate_keys(50, seed=7) == generate_keys(50, seed=7)
+        assert generate_keys(50, seed=7) != generate_keys(50, seed=8)
+
+    def test_ordered_distributions(self):
+        """Test sorted, reverse and zigzag orderings"""
+        ordered = generate_keys(6, seed=3, distribution='sorted')
+        assert ordered == sorted(ordered)
+
+        reverse = generate_keys(6, seed=3, distribution='reverse')
+        assert reverse == sorted(reverse, reverse=True)
+
+        zigzag = generate_keys(6, seed=3, distribution='zigzag')
+        low, high = sorted(zigzag), sorted(zigzag, reverse=True)
+        assert zigzag == [low[0], high[0], low[1], high[1], low[2], high[2]]
+
+    def test_invalid_arguments(self):
+        """Test unknown distributions and out of range sizes are rejected"""
+        with pytest.raises(ValueError):
+            generate_keys(10, distribution='gaussian')
+        with pytest.raises(ValueError):
+            generate_keys(-1)
+
+
+class TestGenerateTree:
+    """Test cases for tree generation"""
+
+    @pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+    def test_random_shape_matches_insertion(self, distribution):
+        """Test the random shape equals inserting keys in generated order"""
+        keys = generate_keys(100, seed=5, distribution=distribution)
+        tree = generate_tree(100, seed=5, distribution=distribution, shape='random')
+        expected = insert_all(keys)
+
+        assert tree.size == 100
+        assert tree.preorder_traversal() == expected.preorder_traversal()
+        assert tree.height() == expected.height()
+
+    def test_balanced_shape(self):
+        """Test the balanced shape has minimal height"""
+        tree = generate_tree(1023, seed=2, shape='balanced')
+        assert tree.size == 1023
+        assert tree.height() == 9
+        assert tree.inorder_traversal() == sorted(tree.inorder_traversal())
+
+    def test_degenerate_shape(self):
+        """Test the degenerate shape is a single chain"""
+        tree = generate_tree(2000, seed=2, shape='degenerate')
+        assert tree.size == 2000
+        assert tree.height() == 1999
+        assert len(str(tree).splitlines()) == 2000
+
+    def test_deep_degenerate_tree_serializes(self):
+        """Test chains deeper than the recursion limit serialize and traverse"""
+        tree = generate_tree(5000, seed=2, shape='degenerate')
+        keys = sorted(tree.inorder_traversal())
+
+        node = tree.to_dict()['root']
+        depth = 0
+        while node['right'] is not None:
+            node, depth = node['right'], depth + 1
+        assert depth == 4999
+
+        assert tree.inorder_traversal() == keys
+        assert tree.preorder_traversal() == keys
+        assert tree.postorder_traversal() == keys[::-1]
+        assert tree.level_order_traversal() == keys
+
+        assert tree.search(keys[-1]) is True
+        assert tree.insert(keys[-1] + 1) is True
+        assert tree.delete(keys[0]) is True
+        assert tree.size == 5000
+
+    def test_parent_pointers(self):
+        """Test generated nodes link back to their parents"""
+        tree = generate_tree(300, seed=9, shape='random')
+        assert_parent_pointers(tree)
+
+    def test_populates_existing_tree(self):
+        """Test generating into an existing tree replaces its contents"""
+        tree = insert_all([1, 2, 3])
+        result = generate_tree(10, seed=4, tree=tree)
+        assert result is tree
+        assert tree.size == 10
+        assert tree.get_operation_steps() == []
+
+    def test_invalid_shape(self):
+        """Test unknown shapes are rejected"""
+        with pytest.raises(ValueError):
+            generate_tree(10, shape='bushy')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+"""
+Test suite for the paged node layout
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from binary_search_tree import BinarySearchTree
+from scapegoat_tree import ScapegoatTree
+from tree_layout import FIELDS, node_layout
+from tree_generator import generate_tree
+
+
+def rows(tree):
+    layout = node_layout(tree)
+    return list(zip(*(layout[field] for field in FIELDS)))
+
+
+class TestNodeLayout:
+    """Test cases for node_layout"""
+
+    def test_records_in_bfs_order(self):
+        """Test records carry parent, depth and inorder rank"""
+        bst = BinarySearchTree()
+        for value in [10, 5, 15, 3, 7, 20]:
+            bst.insert(value)
+        assert rows(bst) == [
+            (10, -1, 0, 3, 0),
+            (5, 0, 1, 1, 0),
+            (15, 0, 1, 4, 0),
+            (3, 1, 2, 0, 0),
+            (7, 1, 2, 2, 0),
+            (20, 2, 2, 5, 0)
+        ]
+
+    def test_empty_tree(self):
+        """Test an empty tree has no records"""
+        layout = node_layout(BinarySearchTree())
+        assert all(len(layout[field]) == 0 for field in FIELDS)
+
+    def test_parents_precede_children(self):
+        """Test every record's parent appears earlier"""
+        records = rows(generate_tree(500, seed=8))
+        assert sorted(record[3] for record in records) == list(range(500))
+        for index, (_, parent, depth, _, _) in enumerate(records[1:], start=1):
+            assert parent < index
+            assert records[parent][2] == depth - 1
+
+    def test_tombstones_flagged(self):
+        """Test deleted nodes keep their place and are flagged"""
+        tree = ScapegoatTree()
+        for value in [10, 5, 15]:
+            tree.insert(value)
+        tree.delete(5)
+        assert rows(tree)[1] == (5, 0, 1, 0, 1)
+
+    def test_deep_chain(self):
+        """Test chains deeper than the recursion limit are laid out"""
+        records = rows(generate_tree(5000, seed=2, shape='degenerate'))
+        assert [record[2] for record in records] == list(range(5000))
+        assert [record[3] for record in records] == list(range(5000))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -132,12 +132,15 @@ function App() {
         case 'random':
           response = await BSTService.generateRandom();
           break;
+        case 'generate':
+          response = await BSTService.generate(value);
+          break;
         default:
           throw new Error('Unknown operation');
       }
       
       setTreeState(response.tree_state);
-      setOperationSteps(response.operation_steps);
+      setOperationSteps(response.operation_steps || []);
       setMessage(response.message);
     } catch (error) {
       console.error('Error performing operation:', error);
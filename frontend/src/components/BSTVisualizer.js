@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import styled from 'styled-components';
 import { motion, AnimatePresence } from 'framer-motion';
 import TreeNode from './TreeNode';
+import CanvasTreeView from './CanvasTreeView';
 
 const TreeContainer = styled.div`
   width: 100%;
@@ -96,6 +97,19 @@ const BSTVisualizer = ({ treeState, operationSteps, isLoading }) => {
   }, [operationSteps]);
 
   const renderTree = () => {
+    // Trees too large for one animated DOM element per node arrive paged,
+    // without a nested root, and are drawn by the canvas renderer instead.
+    if (treeState && treeState.paged) {
+      return (
+        <CanvasTreeView
+          treeState={treeState}
+          operationSteps={operationSteps}
+          currentStep={currentStep}
+          isAnimating={isAnimating}
+        />
+      );
+    }
+
     if (!treeState || !treeState.root) {
       return (
         <EmptyState
@@ -143,7 +157,14 @@ const BSTVisualizer = ({ treeState, operationSteps, isLoading }) => {
       'delete_no_left': `Deleting ${step.value}, replacing with right child`,
       'delete_no_right': `Deleting ${step.value}, replacing with left child`,
       'delete_two_children': `Deleting ${step.value}, replacing with successor ${step.successor}`,
-      'delete_not_found': `Value ${step.value} not found for deletion`
+      'delete_not_found': `Value ${step.value} not found for deletion`,
+      'delete_join': `Deleted ${step.value}, joined subtrees under ${step.replacement}`,
+      'delete_tombstone': `Marked ${step.value} as deleted`,
+      'insert_revive': `Restored deleted value ${step.value}`,
+      'rebuild': `Rebuilding subtree at ${step.current_node} (${step.reason})`,
+      'splay_zig': `Splaying ${step.value}: zig rotation`,
+      'splay_zig_zig': `Splaying ${step.value}: zig-zig rotation`,
+      'splay_zig_zag': `Splaying ${step.value}: zig-zag rotation`
     };
 
     return actionMessages[step.action] || step.action;
@@ -0,0 +1,383 @@
+import React, { useState, useEffect, useRef, useCallback } from 'react';
+import styled from 'styled-components';
+import { BSTService } from '../services/bstService';
+
+const PAGE_SIZE = 20000;
+const NODE_RADIUS = 18;
+const X_SPACING = 44;
+const LEVEL_HEIGHT = 70;
+const MIN_SCALE = 0.0001;
+const MAX_SCALE = 4;
+
+const STATE_COLORS = {
+  'default': '#6b7280',
+  'tombstone': '#cbd5e1',
+  'visited': '#f59e0b',
+  'found': '#10b981',
+  'current': '#3b82f6',
+  'inserted': '#8b5cf6',
+  'deleted': '#ef4444'
+};
+
+const CanvasContainer = styled.div`
+  position: absolute;
+  top: 0;
+  left: 0;
+  right: 0;
+  bottom: 0;
+`;
+
+const Canvas = styled.canvas`
+  display: block;
+  width: 100%;
+  height: 100%;
+  cursor: grab;
+
+  &:active {
+    cursor: grabbing;
+  }
+`;
+
+const Badge = styled.div`
+  position: absolute;
+  bottom: 15px;
+  right: 15px;
+  background: rgba(0, 0, 0, 0.7);
+  color: white;
+  padding: 6px 12px;
+  border-radius: 8px;
+  font-size: 0.8rem;
+  font-weight: 500;
+  pointer-events: none;
+`;
+
+// Nodes arrive as flat BFS-ordered pages of [value, parent, depth, rank,
+// deleted]. Parents always precede children, so each page can be placed
+// as soon as it lands: the inorder rank is the column and depth the row.
+const createStore = (total) => ({
+  total,
+  loaded: 0,
+  values: new Float64Array(total),
+  parents: new Int32Array(total),
+  depths: new Int32Array(total),
+  ranks: new Int32Array(total),
+  deleted: new Uint8Array(total),
+  children: new Int32Array(total * 2).fill(-1),
+  byRank: new Int32Array(total).fill(-1),
+  byValue: new Map()
+});
+
+const appendPage = (store, offset, nodes) => {
+  nodes.forEach(([value, parent, depth, rank, deleted], i) => {
+    const index = offset + i;
+    store.values[index] = value;
+    store.parents[index] = parent;
+    store.depths[index] = depth;
+    store.ranks[index] = rank;
+    store.deleted[index] = deleted;
+    store.byRank[rank] = index;
+    store.byValue.set(value, index);
+    if (parent !== -1) {
+      const slot = store.children[parent * 2] === -1 ? parent * 2 : parent * 2 + 1;
+      store.children[slot] = index;
+    }
+  });
+  store.loaded = offset + nodes.length;
+};
+
+// Same step-to-colour rules as TreeNode, keyed by node value.
+const getStepHighlights = (step) => {
+  const highlights = new Map();
+  if (!step) return highlights;
+
+  if (step.action === 'insert_left' || step.action === 'insert_right' ||
+      step.action === 'insert_root') {
+    highlights.set(step.value, 'inserted');
+  }
+  if (step.action === 'delete_no_left' || step.action === 'delete_no_right' ||
+      step.action === 'delete_two_children') {
+    highlights.set(step.value, 'deleted');
+  }
+  if (step.current_node !== undefined) {
+    if (step.action === 'found' || step.action === 'insert_root' ||
+        step.action === 'insert_left' || step.action === 'insert_right') {
+      highlights.set(step.current_node, 'found');
+    } else if (step.action === 'visit_node' || step.action === 'delete_visit') {
+      highlights.set(step.current_node, 'visited');
+    } else {
+      highlights.set(step.current_node, 'current');
+    }
+  }
+  return highlights;
+};
+
+const clampScale = (scale) => Math.min(MAX_SCALE, Math.max(MIN_SCALE, scale));
+
+const getViewport = (canvas) => {
+  const ratio = window.devicePixelRatio || 1;
+  return { width: canvas.width / ratio, height: canvas.height / ratio, ratio };
+};
+
+// Whole tree width on screen, root row just below the top edge.
+const fitView = (canvas, total) => {
+  const { width } = getViewport(canvas);
+  const scale = clampScale(Math.min(1, width / (Math.max(1, total) * X_SPACING)));
+  return {
+    x: ((total - 1) * X_SPACING) / 2 - width / scale / 2,
+    y: -LEVEL_HEIGHT / 2,
+    scale
+  };
+};
+
+const CanvasTreeView = ({ treeState, operationSteps, currentStep, isAnimating }) => {
+  const containerRef = useRef(null);
+  const canvasRef = useRef(null);
+  const storeRef = useRef(null);
+  const viewRef = useRef({ x: 0, y: 0, scale: 1 });
+  const dragRef = useRef(null);
+  const frameRef = useRef(null);
+  const highlightsRef = useRef(new Map());
+  const [progress, setProgress] = useState({ loaded: 0, total: 0 });
+  // Steps and searches that leave the tree as it was keep its version, so
+  // the layout is only paged in again when the tree actually changed.
+  const version = treeState.version;
+
+  const draw = useCallback(() => {
+    frameRef.current = null;
+    const canvas = canvasRef.current;
+    const store = storeRef.current;
+    if (!canvas) return;
+
+    const { width, height, ratio } = getViewport(canvas);
+    const context = canvas.getContext('2d');
+    context.setTransform(ratio, 0, 0, ratio, 0, 0);
+    context.clearRect(0, 0, width, height);
+    if (!store || store.loaded === 0) return;
+
+    const { x, y, scale } = viewRef.current;
+    const screenX = (index) => (store.ranks[index] * X_SPACING - x) * scale;
+    const screenY = (index) => (store.depths[index] * LEVEL_HEIGHT - y) * scale;
+    const radius = NODE_RADIUS * scale;
+
+    // Only the columns on screen are visited, and once several ranks share
+    // a pixel column only every stride-th one is drawn.
+    const firstRank = Math.max(0, Math.floor((x - NODE_RADIUS) / X_SPACING));
+    const lastRank = Math.min(store.total - 1, Math.ceil((x + width / scale + NODE_RADIUS) / X_SPACING));
+    const stride = Math.max(1, Math.floor(1 / (X_SPACING * scale)));
+    const minDepth = Math.floor((y - NODE_RADIUS) / LEVEL_HEIGHT);
+    const maxDepth = Math.ceil((y + height / scale + NODE_RADIUS) / LEVEL_HEIGHT);
+
+    const visible = [];
+    for (let rank = firstRank; rank <= lastRank; rank += stride) {
+      const index = store.byRank[rank];
+      if (index === -1) continue;
+      const depth = store.depths[index];
+      if (depth >= minDepth && depth <= maxDepth) {
+        visible.push(index);
+      }
+    }
+
+    context.strokeStyle = '#94a3b8';
+    context.lineWidth = Math.max(0.5, 2 * scale);
+    context.beginPath();
+    visible.forEach(index => {
+      const neighbours = [store.parents[index], store.children[index * 2], store.children[index * 2 + 1]];
+      neighbours.forEach(other => {
+        if (other === -1 || other >= store.loaded) return;
+        context.moveTo(screenX(index), screenY(index));
+        context.lineTo(screenX(other), screenY(other));
+      });
+    });
+    context.stroke();
+
+    const drawNode = (index, state) => {
+      const cx = screenX(index);
+      const cy = screenY(index);
+      context.fillStyle = STATE_COLORS[state];
+      if (radius < 4) {
+        const size = Math.max(1.5, radius * 2);
+        context.fillRect(cx - size / 2, cy - size / 2, size, size);
+        return;
+      }
+      context.beginPath();
+      context.arc(cx, cy, radius, 0, Math.PI * 2);
+      context.fill();
+      context.strokeStyle = 'white';
+      context.lineWidth = Math.max(1, 3 * scale);
+      context.stroke();
+      if (radius >= 10) {
+        context.fillStyle = 'white';
+        context.font = `600 ${Math.round(14 * scale)}px Inter, sans-serif`;
+        context.textAlign = 'center';
+        context.textBaseline = 'middle';
+        context.fillText(String(store.values[index]), cx, cy);
+      }
+    };
+
+    const highlights = highlightsRef.current;
+    visible.forEach(index => {
+      if (!highlights.has(store.values[index])) {
+        drawNode(index, store.deleted[index] ? 'tombstone' : 'default');
+      }
+    });
+    // Highlighted nodes are drawn last and even when sampling skipped them.
+    highlights.forEach((state, value) => {
+      const index = store.byValue.get(value);
+      if (index !== undefined) {
+        drawNode(index, state);
+      }
+    });
+  }, []);
+
+  const requestDraw = useCallback(() => {
+    if (frameRef.current === null) {
+      frameRef.current = requestAnimationFrame(draw);
+    }
+  }, [draw]);
+
+  useEffect(() => {
+    let cancelled = false;
+    // The first tree is drawn page by page; later trees replace it only
+    // once complete, so replaying steps never shows a half-loaded tree.
+    const progressive = storeRef.current === null;
+
+    const load = async () => {
+      let store = null;
+      let snapshotId = null;
+      while (!cancelled) {
+        const page = await BSTService.getNodes(store ? store.loaded : 0, PAGE_SIZE, snapshotId);
+        if (cancelled) return;
+        if (page.snapshot_id !== snapshotId) {
+          snapshotId = page.snapshot_id;
+          store = createStore(page.total);
+        }
+        appendPage(store, page.offset, page.nodes);
+        setProgress({ loaded: store.loaded, total: store.total });
+
+        if (progressive) {
+          if (storeRef.current !== store) {
+            storeRef.current = store;
+            viewRef.current = fitView(canvasRef.current, store.total);
+          }
+          requestDraw();
+        }
+        if (store.loaded >= store.total) break;
+      }
+      if (!cancelled && !progressive) {
+        storeRef.current = store;
+        requestDraw();
+      }
+    };
+
+    load().catch(error => console.error('Error loading tree nodes:', error));
+    return () => {
+      cancelled = true;
+    };
+  }, [version, requestDraw]);
+
+  useEffect(() => {
+    const step = isAnimating && operationSteps ? operationSteps[currentStep] : null;
+    highlightsRef.current = getStepHighlights(step);
+
+    // Keep the node the step is about on screen.
+    const store = storeRef.current;
+    const focus = step ? (step.current_node !== undefined ? step.current_node : step.value) : undefined;
+    const index = store && focus !== undefined ? store.byValue.get(focus) : undefined;
+    if (index !== undefined) {
+      const { width, height } = getViewport(canvasRef.current);
+      const view = viewRef.current;
+      const worldX = store.ranks[index] * X_SPACING;
+      const worldY = store.depths[index] * LEVEL_HEIGHT;
+      const sx = (worldX - view.x) * view.scale;
+      const sy = (worldY - view.y) * view.scale;
+      if (sx < 0 || sx > width || sy < 0 || sy > height) {
+        viewRef.current = {
+          ...view,
+          x: worldX - width / view.scale / 2,
+          y: worldY - height / view.scale / 2
+        };
+      }
+    }
+    requestDraw();
+  }, [operationSteps, currentStep, isAnimating, requestDraw]);
+
+  useEffect(() => {
+    const container = containerRef.current;
+    const canvas = canvasRef.current;
+    const resize = () => {
+      const ratio = window.devicePixelRatio || 1;
+      canvas.width = Math.round(container.clientWidth * ratio);
+      canvas.height = Math.round(container.clientHeight * ratio);
+      requestDraw();
+    };
+    resize();
+    const observer = new ResizeObserver(resize);
+    observer.observe(container);
+
+    // Registered by hand because React attaches wheel listeners as passive,
+    // which would not allow preventing the page from scrolling.
+    const handleWheel = (event) => {
+      event.preventDefault();
+      const rect = canvas.getBoundingClientRect();
+      const px = event.clientX - rect.left;
+      const py = event.clientY - rect.top;
+      const view = viewRef.current;
+      const scale = clampScale(view.scale * Math.exp(-event.deltaY * 0.0015));
+      viewRef.current = {
+        x: view.x + px / view.scale - px / scale,
+        y: view.y + py / view.scale - py / scale,
+        scale
+      };
+      requestDraw();
+    };
+    canvas.addEventListener('wheel', handleWheel, { passive: false });
+
+    return () => {
+      observer.disconnect();
+      canvas.removeEventListener('wheel', handleWheel);
+      if (frameRef.current !== null) {
+        cancelAnimationFrame(frameRef.current);
+        frameRef.current = null;
+      }
+    };
+  }, [requestDraw]);
+
+  const handleMouseDown = (event) => {
+    dragRef.current = { x: event.clientX, y: event.clientY };
+  };
+
+  const handleMouseMove = (event) => {
+    if (!dragRef.current) return;
+    const view = viewRef.current;
+    viewRef.current = {
+      ...view,
+      x: view.x - (event.clientX - dragRef.current.x) / view.scale,
+      y: view.y - (event.clientY - dragRef.current.y) / view.scale
+    };
+    dragRef.current = { x: event.clientX, y: event.clientY };
+    requestDraw();
+  };
+
+  const handleMouseUp = () => {
+    dragRef.current = null;
+  };
+
+  return (
+    <CanvasContainer ref={containerRef}>
+      <Canvas
+        ref={canvasRef}
+        onMouseDown={handleMouseDown}
+        onMouseMove={handleMouseMove}
+        onMouseUp={handleMouseUp}
+        onMouseLeave={handleMouseUp}
+      />
+      <Badge>
+        {progress.loaded < progress.total
+          ? `Loading ${progress.loaded.toLocaleString()} / ${progress.total.toLocaleString()} nodes`
+          : `${progress.total.toLocaleString()} nodes · scroll to zoom, drag to pan`}
+      </Badge>
+    </CanvasContainer>
+  );
+};
+
+export default CanvasTreeView;
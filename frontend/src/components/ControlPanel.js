@@ -48,6 +48,22 @@ const Input = styled.input`
   }
 `;
 
+const Select = styled.select`
+  width: 100%;
+  padding: 12px 16px;
+  border: 2px solid #e5e7eb;
+  border-radius: 10px;
+  font-size: 1rem;
+  background: white;
+  box-sizing: border-box;
+  
+  &:focus {
+    outline: none;
+    border-color: #3b82f6;
+    box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
+  }
+`;
+
 const ButtonGroup = styled.div`
   display: grid;
   grid-template-columns: 1fr 1fr;
@@ -163,6 +179,8 @@ const ControlPanel = ({ onOperation, isLoading, message }) => {
   const [insertValue, setInsertValue] = useState('');
   const [deleteValue, setDeleteValue] = useState('');
   const [searchValue, setSearchValue] = useState('');
+  const [generateSize, setGenerateSize] = useState('');
+  const [generateShape, setGenerateShape] = useState('random');
 
   const handleInsert = () => {
     const value = parseInt(insertValue);
@@ -188,6 +206,14 @@ const ControlPanel = ({ onOperation, isLoading, message }) => {
     }
   };
 
+  const handleGenerate = () => {
+    const size = parseInt(generateSize);
+    if (!isNaN(size)) {
+      onOperation('generate', { size, shape: generateShape });
+      setGenerateSize('');
+    }
+  };
+
   const handleKeyPress = (e, operation) => {
     if (e.key === 'Enter') {
       switch (operation) {
@@ -200,6 +226,9 @@ const ControlPanel = ({ onOperation, isLoading, message }) => {
         case 'search':
           handleSearch();
           break;
+        case 'generate':
+          handleGenerate();
+          break;
         default:
           break;
       }
@@ -300,6 +329,40 @@ const ControlPanel = ({ onOperation, isLoading, message }) => {
         Search
       </Button>
       
+      <InputGroup>
+        <Label>Generate Tree</Label>
+        <Input
+          type="number"
+          min="0"
+          placeholder="Number of nodes"
+          value={generateSize}
+          onChange={(e) => setGenerateSize(e.target.value)}
+          onKeyPress={(e) => handleKeyPress(e, 'generate')}
+          disabled={isLoading}
+          style={{ marginBottom: '10px' }}
+        />
+        <Select
+          value={generateShape}
+          onChange={(e) => setGenerateShape(e.target.value)}
+          disabled={isLoading}
+        >
+          <option value="random">Random insertion order</option>
+          <option value="balanced">Balanced</option>
+          <option value="degenerate">Degenerate chain</option>
+        </Select>
+      </InputGroup>
+      
+      <Button
+        className="secondary"
+        onClick={handleGenerate}
+        disabled={isLoading || !generateSize}
+        whileHover={{ scale: 1.02 }}
+        whileTap={{ scale: 0.98 }}
+        style={{ width: '100%', marginBottom: '20px' }}
+      >
+        Generate
+      </Button>
+      
       <FullWidthButton
         className="warning"
         onClick={() => onOperation('clear')}
@@ -122,9 +122,11 @@ const TreeNode = ({ node, x, y, level, isAnimating, currentStep, operationSteps
     return 'default';
   };
 
-  const nodeState = getNodeState();
+  const animatedState = getNodeState();
+  const nodeState = node.deleted && animatedState === 'default' ? 'tombstone' : animatedState;
   const nodeColor = {
     'default': '#6b7280',
+    'tombstone': '#cbd5e1',
     'visited': '#f59e0b',
     'found': '#10b981',
     'current': '#3b82f6',
@@ -33,6 +33,20 @@ class BSTService {
     return response.data;
   }
 
+  static async generate(options) {
+    const response = await axios.post(`${API_BASE_URL}/tree/generate`, options);
+    return response.data;
+  }
+
+  static async getNodes(offset, limit, snapshotId = null) {
+    const params = { offset, limit };
+    if (snapshotId) {
+      params.snapshot_id = snapshotId;
+    }
+    const response = await axios.get(`${API_BASE_URL}/tree/nodes`, { params });
+    return response.data;
+  }
+
   static async getTraversal(type) {
     const response = await axios.get(`${API_BASE_URL}/tree/traversal/${type}`);
     return response.data;